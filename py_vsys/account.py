@@ -2,6 +2,7 @@
 account contains account-related resources
 """
 from __future__ import annotations
+import asyncio
 import os
 from typing import Any, Dict, TYPE_CHECKING, Type, Union
 
@@ -20,6 +21,9 @@ from py_vsys.utils.crypto import curve_25519 as curve
 from py_vsys import words as wd
 from py_vsys.contract import tok_ctrt_factory as tcf
 
+# Node responses are formatted only if a sink takes DEBUG records.
+_debug = logger.opt(lazy=True).debug
+
 
 class Wallet:
     """
@@ -300,7 +304,7 @@ class Account:
                 fee=md.PaymentFee(fee),
             )
         )
-        logger.debug(data)
+        _debug("{}", lambda: data)
         return data
 
     async def _lease(self, req: tx.LeaseTxReq) -> Dict[str, Any]:
@@ -345,7 +349,7 @@ class Account:
                 fee=md.LeasingFee(fee),
             )
         )
-        logger.debug(data)
+        _debug("{}", lambda: data)
         return data
 
     async def _cancel_lease(self, req: tx.LeaseCancelTxReq) -> Dict[str, Any]:
@@ -385,7 +389,7 @@ class Account:
                 fee=md.LeasingCancelFee(fee),
             )
         )
-        logger.debug(data)
+        _debug("{}", lambda: data)
         return data
 
     async def _register_contract(self, req: tx.RegCtrtTxReq) -> Dict[str, Any]:
@@ -416,6 +420,20 @@ class Account:
             req.to_broadcast_execute_payload(self.key_pair)
         )
 
+    def _submit_contract(self, req: tx.ExecCtrtFuncTxReq) -> asyncio.Task:
+        """
+        _submit_contract signs the execute contract transaction request right away and
+        schedules its broadcast without waiting for the response.
+
+        Args:
+            req (tx.ExecCtrtFuncTxReq): The execute contract transaction request.
+
+        Returns:
+            asyncio.Task: The task that resolves to the response returned by the Node API.
+        """
+        payload = req.to_broadcast_execute_payload(self.key_pair)
+        return asyncio.ensure_future(self.api.ctrt.broadcast_execute(payload))
+
     async def _db_put(self, req: tx.DBPutTxReq) -> Dict[str, Any]:
         """
         _db_put sends a DB Put transaction on behalf of the account.
@@ -458,5 +476,5 @@ class Account:
                 fee=md.DBPutFee(fee),
             )
         )
-        logger.debug(data)
+        _debug("{}", lambda: data)
         return data
@@ -3,17 +3,70 @@ api contains NodeAPI-related resources.
 """
 from __future__ import annotations
 import abc
+import asyncio
 import json
 from typing import Any, Dict, Optional, Union, List
 
 import aiohttp
 
+# Transient failures(e.g. a pooled connection closed by the node or a 5xx response) are retried
+# with exponential backoff for GETs & broadcasts of client-signed txs only, as a node may have
+# applied a POST before failing. A signed tx keeps its ID when sent again, so a repeat cannot
+# apply it twice, though if the node had already accepted it the caller gets the duplicate-tx
+# error instead. POSTs the node acts on by itself(e.g. /vsys/payment, which the node signs with
+# a fresh timestamp) are not repeated.
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.2
+
+# Broadcast payloads are encoded without the whitespace that json.dumps adds by default.
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+async def _request(
+    sess: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    data: Optional[str] = None,
+    retry: bool = True,
+) -> Dict[str, Any]:
+    """
+    _request makes an HTTP request with the given session & retries on connection errors
+    and server errors if asked to. The response of the last attempt is returned as is.
+
+    Args:
+        sess (aiohttp.ClientSession): The HTTP request session.
+        method (str): The HTTP method. E.g. "GET".
+        url (str): The url.
+        data (Optional[str], optional): The payload. Defaults to None.
+        retry (bool, optional): If the request is safe to be sent again. Defaults to True.
+
+    Raises:
+        aiohttp.ClientConnectionError: If the connection fails(after MAX_RETRIES retries if retry is True).
+
+    Returns:
+        Dict[str, Any]: The response.
+    """
+    retries = MAX_RETRIES if retry else 0
+    for attempt in range(retries + 1):
+        try:
+            async with sess.request(method, url, data=data) as resp:
+                if resp.status < 500 or attempt == retries:
+                    return await resp.json()
+        except aiohttp.ClientConnectionError:
+            if attempt == retries:
+                raise
+        await asyncio.sleep(RETRY_BACKOFF * 2**attempt)
+
 
 class NodeAPI:
     """
     NodeAPI is the wrapper class for RESTful APIs exposed by a node in the VSYS chain network.
     """
 
+    KEEPALIVE_TIMEOUT = 75
+    MAX_CONNS = 32
+    DNS_CACHE_TTL = 300
+
     def __init__(self, sess: aiohttp.ClientSession):
         self._sess = sess
         self._blocks = Blocks(sess)
@@ -41,10 +94,21 @@ class NodeAPI:
         if api_key:
             headers["api_key"] = api_key
 
+        # Keep idle connections to the node alive long enough to be reused between
+        # transactions instead of re-establishing TCP(and TLS) for each of them.
+        # Concurrent requests beyond MAX_CONNS wait for a pooled connection rather than
+        # opening more sockets to the same node.
+        connector = aiohttp.TCPConnector(
+            limit_per_host=cls.MAX_CONNS,
+            ttl_dns_cache=cls.DNS_CACHE_TTL,
+            keepalive_timeout=cls.KEEPALIVE_TIMEOUT,
+        )
+
         sess = aiohttp.ClientSession(
             base_url=host,
             headers=headers,
             timeout=aiohttp.ClientTimeout(total=timeout),
+            connector=connector,
         )
         return cls(sess)
 
@@ -140,22 +204,34 @@ class NodeAPI:
         Returns:
             Dict[str, Any]: The response.
         """
-        async with self._sess.get(edpt) as resp:
-            return await resp.json()
+        return await _request(self._sess, "GET", edpt)
 
-    async def post(self, edpt: str, data: str) -> Dict[str, Any]:
+    async def post(self, edpt: str, data: str, retry: bool = False) -> Dict[str, Any]:
         """
         post calls the given endpoint with HTTP POST with the given data.
 
         Args:
             edpt (str): The endpoint name.
             data (str): The payload. Either a JSON string or a plain text string.
+            retry (bool, optional): If the request is safe to be sent again on transient failures.
+                Defaults to False.
 
         Returns:
             Dict[str, Any]: The response.
         """
-        async with self._sess.post(edpt, data=data) as resp:
-            return await resp.json()
+        return await _request(self._sess, "POST", edpt, data, retry)
+
+    async def close(self) -> None:
+        """
+        close closes the HTTP session & the pooled connections of the NodeAPI.
+        """
+        await self._sess.close()
+
+    async def __aenter__(self) -> NodeAPI:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
 
 
 class APIGrp(abc.ABC):
@@ -196,24 +272,24 @@ class APIGrp(abc.ABC):
         """
         url = self._make_url(edpt)
 
-        async with self._sess.get(url) as resp:
-            return await resp.json()
+        return await _request(self._sess, "GET", url)
 
-    async def _post(self, edpt: str, data: str) -> Dict[str, Any]:
+    async def _post(self, edpt: str, data: str, retry: bool = False) -> Dict[str, Any]:
         """
         post calls the given endpoint with HTTP POST with the given data.
 
         Args:
             edpt (str): The endpoint name.
             data (str): The payload. Either a JSON string or a plain text string.
+            retry (bool, optional): If the request is safe to be sent again on transient failures.
+                Defaults to False.
 
         Returns:
             Dict[str, Any]: The response.
         """
         url = self._make_url(edpt)
 
-        async with self._sess.post(url, data=data) as resp:
-            return await resp.json()
+        return await _request(self._sess, "POST", url, data, retry)
 
 
 class Blocks(APIGrp):
@@ -300,7 +376,7 @@ class Utils(APIGrp):
     PREFIX = "/utils"
 
     async def hash_fast(self, data: str) -> Dict[str, Any]:
-        return await self._post("/hash/fast", data)
+        return await self._post("/hash/fast", data, retry=True)
 
 
 class Node(APIGrp):
@@ -356,6 +432,15 @@ class Contract(APIGrp):
 
     PREFIX = "/contract"
 
+    def __init__(self, sess: aiohttp.ClientSession):
+        """
+        Args:
+            sess (aiohttp.ClientSession): The HTTP request session.
+        """
+        super().__init__(sess)
+        # The in-flight contract data requests keyed by endpoint.
+        self._inflight: Dict[str, asyncio.Future] = {}
+
     async def get_tok_id(self, ctrt_id: str, tok_idx: int) -> Dict[str, Any]:
         """
         get_tok_id gets the token ID of the given contract with the given token index.
@@ -379,7 +464,7 @@ class Contract(APIGrp):
         Returns:
             Dict[str, Any]: The response.
         """
-        return await self._post("/broadcast/register", json.dumps(data))
+        return await self._post("/broadcast/register", _dumps(data), retry=True)
 
     async def broadcast_execute(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -391,11 +476,12 @@ class Contract(APIGrp):
         Returns:
             Dict[str, Any]: The response.
         """
-        return await self._post("/broadcast/execute", json.dumps(data))
+        return await self._post("/broadcast/execute", _dumps(data), retry=True)
 
     async def get_ctrt_data(self, ctrt_id: str, db_key: str) -> Dict[str, Any]:
         """
         get_ctrt_data gets the data of a contract with the given DB key.
+        Concurrent calls for the same data share one HTTP request(and hence the same response object).
 
         Args:
             ctrt_id (str): The contract ID.
@@ -404,7 +490,33 @@ class Contract(APIGrp):
         Returns:
             Dict[str, Any]: The response.
         """
-        return await self._get(f"/data/{ctrt_id}/{db_key}")
+        edpt = f"/data/{ctrt_id}/{db_key}"
+
+        fut = self._inflight.get(edpt)
+        if fut is None:
+            fut = asyncio.ensure_future(self._get(edpt))
+            self._inflight[edpt] = fut
+            fut.add_done_callback(lambda _: self._inflight.pop(edpt, None))
+        return await asyncio.shield(fut)
+
+    async def get_ctrt_data_batch(
+        self, ctrt_id: str, db_keys: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        get_ctrt_data_batch gets the data of a contract with each of the given DB keys.
+        The node serves one DB key per request, so the requests are made concurrently
+        over the pooled connections of the session.
+
+        Args:
+            ctrt_id (str): The contract ID.
+            db_keys (List[str]): The DB keys.
+
+        Returns:
+            List[Dict[str, Any]]: The responses in the same order as db_keys.
+        """
+        return await asyncio.gather(
+            *[self.get_ctrt_data(ctrt_id, db_key) for db_key in db_keys]
+        )
 
     async def get_ctrt_info(self, ctrt_id: str) -> Dict[str, Any]:
         """
@@ -529,7 +641,7 @@ class Database(APIGrp):
         Returns:
             Dict[str, Any]: The response.
         """
-        return await self._post("/broadcast/put", json.dumps(data))
+        return await self._post("/broadcast/put", _dumps(data), retry=True)
 
     async def get(self, addr: str, db_key: str) -> Dict[str, Any]:
         """
@@ -562,7 +674,7 @@ class Leasing(APIGrp):
         Returns:
             Dict[str, Any]: The response.
         """
-        return await self._post("/broadcast/lease", json.dumps(data))
+        return await self._post("/broadcast/lease", _dumps(data), retry=True)
 
     async def broadcast_cancel(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -574,7 +686,7 @@ class Leasing(APIGrp):
         Returns:
             Dict[str, Any]: The response.
         """
-        return await self._post("/broadcast/cancel", json.dumps(data))
+        return await self._post("/broadcast/cancel", _dumps(data), retry=True)
 
 
 class VSYS(APIGrp):
@@ -594,7 +706,7 @@ class VSYS(APIGrp):
         Returns:
             Dict[str, Any]: The response.
         """
-        return await self._post("/broadcast/payment", json.dumps(data))
+        return await self._post("/broadcast/payment", _dumps(data), retry=True)
 
     async def payment(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -606,4 +718,4 @@ class VSYS(APIGrp):
         Returns:
             Dict[str, Any]: The response.
         """
-        return await self._post("/payment", json.dumps(data))
+        return await self._post("/payment", _dumps(data))
@@ -3,20 +3,81 @@ contract contains shared resources for smart contracts
 """
 from __future__ import annotations
 import abc
+import asyncio
 import enum
+import functools
+import pkgutil
 import struct
-from typing import TYPE_CHECKING, NamedTuple, Any
+from typing import (
+    TYPE_CHECKING,
+    NamedTuple,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 
 from loguru import logger
 
 # https://stackoverflow.com/a/39757388
 if TYPE_CHECKING:
     from py_vsys import chain as ch
+    from py_vsys import api
 
 from py_vsys import data_entry as de
 from py_vsys import model as md
 from py_vsys.utils.crypto import hashes as hs
 
+# Every state query goes through Ctrt._query_db_key, so its response is logged lazily.
+_debug = logger.opt(lazy=True).debug
+
+# The precompiled format of the function indexes.
+_U16 = struct.Struct(">H")
+# The serialized forms of all single-byte indexes(i.e. state variables & state map indexes).
+_BYTES_OF = tuple(bytes((i,)) for i in range(256))
+
+
+@functools.lru_cache(maxsize=256)
+def _attachment(attachment: str) -> md.Str:
+    """
+    _attachment returns the md.Str for the given attachment of a contract action.
+    Attachments are mostly empty or repeated, so the validated instances are reused.
+
+    Args:
+        attachment (str): The attachment.
+
+    Returns:
+        md.Str: The md.Str instance.
+    """
+    return md.Str(attachment)
+
+
+class LazyCtrtMeta:
+    """
+    LazyCtrtMeta is the descriptor for the meta data(CTRT_META) of a contract class.
+    The base58 string is kept in the resource file "meta/<name>.b58" of this package.
+    It is read & decoded into md.CtrtMeta on the first access instead of on import,
+    and the result is kept for the later accesses.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Args:
+            name (str): The name of the resource file without the ".b58" suffix. E.g. "lock_ctrt".
+        """
+        self._name = name
+        self._meta: Optional[md.CtrtMeta] = None
+
+    def __get__(self, obj: Any, owner: type) -> md.CtrtMeta:
+        if self._meta is None:
+            b58_str = pkgutil.get_data(__name__, f"meta/{self._name}.b58")
+            self._meta = md.CtrtMeta.from_b58_str(b58_str.decode("ascii").strip())
+        return self._meta
+
 
 class Ctrt(abc.ABC):
     """
@@ -70,7 +131,7 @@ class Ctrt(abc.ABC):
             Returns:
                 bytes: The serialization result.
             """
-            return struct.pack(">H", self.value)
+            return _U16.pack(self.value)
 
     class StateVar(enum.Enum):
         """
@@ -84,7 +145,7 @@ class Ctrt(abc.ABC):
             Returns:
                 bytes: The serialization result.
             """
-            return struct.pack(">B", self.value)
+            return _BYTES_OF[self.value]
 
     class StateMapIdx(enum.Enum):
         """
@@ -106,14 +167,30 @@ class Ctrt(abc.ABC):
             Returns:
                 bytes: The serialization result.
             """
-            b = struct.pack(">B", self.idx.value) + self.data_entry.serialize()
-            return b
+            return _BYTES_OF[self.idx.value] + self.data_entry.serialize()
 
     class DBKey(md.Bytes):
         """
         DBKey is the class for DB key of a contract used to query data.
         """
 
+        __slots__ = ("_b58_str",)
+
+        @property
+        def b58_str(self) -> str:
+            """
+            b58_str returns the base58 string representation of the DB key.
+            A DB key is immutable & sent with every query of it, so the string is encoded once.
+
+            Returns:
+                str: The base58 string representation.
+            """
+            try:
+                return self._b58_str
+            except AttributeError:
+                b58_str = self._b58_str = md.Bytes.b58_str.fget(self)
+                return b58_str
+
     def __init__(self, ctrt_id: str, chain: ch.Chain) -> None:
         """
         Args:
@@ -143,23 +220,161 @@ class Ctrt(abc.ABC):
         """
         return self._chain
 
-    async def _query_db_key(self, db_key: Ctrt.DBKey) -> Any:
+    @property
+    def _api(self) -> api.NodeAPI:
+        """
+        _api returns the NodeAPI object of the chain where the contract is on.
+        The NodeAPI keeps one HTTP session(and hence the pooled connections) for the chain,
+        so the session is asserted to be alive before it is reused.
+
+        Raises:
+            RuntimeError: If the HTTP session of the NodeAPI has been closed.
+
+        Returns:
+            api.NodeAPI: The NodeAPI object.
+        """
+        node_api = self._chain.api
+        if node_api.sess.closed:
+            raise RuntimeError("The HTTP session of the NodeAPI has been closed")
+        return node_api
+
+    async def _query_db_key(
+        self, db_key: Ctrt.DBKey, value_type: Optional[type] = None
+    ) -> Any:
         """
         _query_db_key queries the data by the given db_key.
 
+        Args:
+            db_key (Ctrt.DBKey): The db key.
+            value_type (Optional[type], optional): The type to convert the result to. E.g. bool.
+                Defaults to None, which means the result is returned as is.
+
+        Returns:
+            Any: The result.
+        """
+        val = await self._fetch_db_key(db_key)
+        return self._as_type(val, value_type)
+
+    @staticmethod
+    def _as_type(val: Any, value_type: Optional[type]) -> Any:
+        """
+        _as_type converts the queried value to the given type.
+        Booleans may come either as JSON booleans or as the strings "true" & "false".
+
+        Args:
+            val (Any): The queried value.
+            value_type (Optional[type]): The type to convert to. None means no conversion.
+
+        Returns:
+            Any: The converted value.
+        """
+        if value_type is None:
+            return val
+        if value_type is bool:
+            return val is True or val == "true"
+        return value_type(val)
+
+    async def _query_db_keys(self, db_keys: List[Ctrt.DBKey]) -> List[Any]:
+        """
+        _query_db_keys queries the data by each of the given db_keys in one batch.
+
+        Args:
+            db_keys (List[Ctrt.DBKey]): The db keys.
+
+        Returns:
+            List[Any]: The results in the same order as db_keys.
+        """
+        resps = await self._api.ctrt.get_ctrt_data_batch(
+            ctrt_id=self.ctrt_id.data,
+            db_keys=[db_key.b58_str for db_key in db_keys],
+        )
+        _debug("{}", lambda: resps)
+        return [resp["value"] for resp in resps]
+
+    async def _fetch_db_key(self, db_key: Ctrt.DBKey) -> Any:
+        """
+        _fetch_db_key queries the data by the given db_key from the node.
+
         Args:
             db_key (Ctrt.DBKey): The db key.
 
         Returns:
             Any: The result.
         """
-        data = await self.chain.api.ctrt.get_ctrt_data(
+        data = await self._api.ctrt.get_ctrt_data(
             ctrt_id=self.ctrt_id.data,
             db_key=db_key.b58_str,
         )
-        logger.debug(data)
+        _debug("{}", lambda: data)
         return data["value"]
 
+    async def _cached_unit(self, name: str, query: Callable[[], Awaitable[int]]) -> int:
+        """
+        _cached_unit returns the unit of the given name, which is queried by the given function only once
+        as a unit never changes once the contract is registered.
+        Concurrent first calls wait on a lock per name so that the query is made once. The locks are
+        created lazily so that they are bound to the running event loop.
+
+        Args:
+            name (str): The name of the unit. E.g. "base_tok".
+            query (Callable[[], Awaitable[int]]): The function that queries the unit.
+
+        Returns:
+            int: The unit.
+        """
+        units = self.__dict__.setdefault("_units", {})
+        try:
+            return units[name]
+        except KeyError:
+            pass
+
+        locks = self.__dict__.setdefault("_unit_locks", {})
+        lock = locks.get(name)
+        if lock is None:
+            lock = locks[name] = asyncio.Lock()
+        async with lock:
+            if name not in units:
+                units[name] = await query()
+        return units[name]
+
+    @staticmethod
+    async def _tok_unit_of(tok_ctrt: Awaitable[BaseTokCtrt]) -> int:
+        """
+        _tok_unit_of queries the unit of the given token contract.
+
+        Args:
+            tok_ctrt (Awaitable[BaseTokCtrt]): The token contract to query the unit of.
+
+        Returns:
+            int: The unit.
+        """
+        tc = await tok_ctrt
+        return await tc.unit
+
+    @staticmethod
+    async def _gather_txs(
+        aws: Iterable[Awaitable[Dict[str, Any]]], return_exceptions: bool = False
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        _gather_txs awaits the given broadcasts of a batch of txs.
+        Every broadcast is awaited even if an earlier one fails, so that none is left running
+        unobserved. The first failure is raised afterwards unless return_exceptions is True.
+
+        Args:
+            aws (Iterable[Awaitable[Dict[str, Any]]]): The broadcasts.
+            return_exceptions (bool, optional): Whether to return the exception of a failed broadcast
+                in its place instead of raising it. Defaults to False.
+
+        Returns:
+            List[Union[Dict[str, Any], BaseException]]: The responses in the order of aws.
+        """
+        data = list(await asyncio.gather(*aws, return_exceptions=True))
+        if not return_exceptions:
+            for d in data:
+                if isinstance(d, BaseException):
+                    raise d
+        return data
+
     @staticmethod
     def get_tok_id(ctrt_id: md.CtrtID, tok_idx: md.TokenIdx) -> md.TokenID:
         """
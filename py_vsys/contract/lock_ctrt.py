@@ -15,7 +15,7 @@ from py_vsys import data_entry as de
 from py_vsys import tx_req as tx
 from py_vsys import model as md
 from py_vsys.contract import tok_ctrt_factory as tcf
-from . import Ctrt, BaseTokCtrt
+from . import Ctrt, BaseTokCtrt, LazyCtrtMeta
 
 
 class LockCtrt(Ctrt):
@@ -23,9 +23,7 @@ class LockCtrt(Ctrt):
     LockCtrt is the class for VSYS Lock contract.
     """
 
-    CTRT_META = md.CtrtMeta.from_b58_str(
-        "4Qgfi31k6qfLxTguJg8AeYzmmgaCTJCEPQyAdoRUUSrFDc91PhkdU6C8QQSsNCFc2xEud2XnuQ4YNJ51HgdNtBdnxZcU5Rnqdzyop41Ck81v4nRKkHpTdTrfD8vTur2w4mTFeTFKVzGvGjpHXUVvT47vZiKLBHSB7FHHpGf69bu8DQGXWu6xnZZkn9v2Rfc9mByhwVLSNghNdRhrQwRWPFJ9Qt7Yb8N8WdmcUCAC6PrC3Ha3Z9w7dyf6CsKcCMS6JmB2gvNQitm9jqAfjRxDdqPBUR6TtyjSdmHP9BZRGgiVCaQH7X8fbJZVWSib4RXvFoSrqY4SfVftDY3PU4hXASaRWbaheB8m4VgM4mA8nKDbZvRWZtZ4cHdWeNFyVPs6HxHQZHrQ3GZGNPjmBSyAkGRFS7i5dK8aYWQDEYu1Xijk63UFAWuf6tRdR44ZgRjWGUZJtdQBDFB38XaU8LSFEj2eaC1yNqZ6nnGeRXDzS1q3YKsGyJTqaDDMHvPHiHonGn76JQHAZN7eGU7biaSLxoikW4MaTPSfmcTmDyPGJyJNHjc8MrpV8aQSaGGyDkf1a9MpoJcyEjsPFQbxYzSJVqFEFg2oUL7Z8VUtJK2kYcWDz7w8UiiQqe3uuQnKDGb1nJ5Ad3W8ZPfVP6YHbJrnBKZXMMypNoveokVvxZMCkSNYDsoBxJzrwFvm5DcDJbePQU6VbeZ5SzQw9XTAw4DZpxkQm9RwRE9PXPqogpp9P6LhaiUa6ZD1cWUAHypjWLJ2Rds96oap3biBp5aESunuh99HByoXg5Aa7EQ3FrEvmeq9TLVFYpJraZyW"
-    )
+    CTRT_META = LazyCtrtMeta("lock_ctrt")
 
     class FuncIdx(Ctrt.FuncIdx):
         """
@@ -55,6 +53,8 @@ class LockCtrt(Ctrt):
         DBKey is the class for DB key of a contract used to query data.
         """
 
+        __slots__ = ()
+
         @classmethod
         def for_maker(cls) -> LockCtrt.DBKey:
             """
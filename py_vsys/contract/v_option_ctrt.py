@@ -2,20 +2,31 @@
 v_option_ctrt contains V Option contract.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING, Dict, Union, Optional
+import asyncio
+import functools
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, Optional
 
 from loguru import logger
 
 # https://stackoverflow.com/a/39757388
 if TYPE_CHECKING:
     from py_vsys import account as acnt
-    from py_vsys import chain as ch
 
+from py_vsys import api
+from py_vsys import chain as ch
 from py_vsys import data_entry as de
 from py_vsys import tx_req as tx
 from py_vsys import model as md
 from py_vsys.contract import tok_ctrt_factory as tcf
-from . import Ctrt, BaseTokCtrt
+from . import Ctrt, BaseTokCtrt, LazyCtrtMeta, _attachment
+
+# Bound once so that building a transaction request skips the attribute lookups on `md`.
+_now = md.VSYSTimestamp.now
+_ts = md.VSYSTimestamp
+_exec_fee = md.ExecCtrtFee
+
+# The payload is only formatted when a sink actually consumes DEBUG records.
+_debug = logger.opt(lazy=True).debug
 
 
 class VOptionCtrt(Ctrt):
@@ -23,9 +34,7 @@ class VOptionCtrt(Ctrt):
     VOptionCtrt is the class for VSYS V Option contract.
     """
 
-    CTRT_META = md.CtrtMeta.from_b58_str(
-        "2Vcyrgk4NQi6yuVa2yobJmcXuZp81ZmxGaDrWMxPzaioQBZ6s9grRKucYDFGbPqnxQ86T8YLyzYWF64Rj7uyAWbkHDqTvnVZMfuMhgrtrmp4ffDwH9dc7g6fNy9PrMefNAYtHh9hw7ThJ8RTcKFiSa4qBBQMy768DaAMrLoWWBXYivvViBeGXTpdeP65CbUWWyqKLTX3Kg8DzHgvQwakXoUTe4fWCjTVBeNaPfQwN8yTtwbgGJ8pr7GUfkxaUVBCJAmVKJEfW4hwvosU2KWCQWFezZwYqevPZj6PsAd1QiSU5axu3oognJiowAUrAY7DFYAeMhmm3tLMDziVHZkvKA3157LXewm7SAqh5EZSCkZSSGZaAMdkk7JkQG5k7KLBb5r791ue8MA1vrVtHd6Tj7URWonFKRGXvb2aSLjGvFQEyCWRkquDmVzBaoyJkaBn6V7TaJoGmXuyLCD7CY6vcMrjnW7wbwNd1UriSn6JqfHCu8fqHXuaBBmgNGnh4tSzPZU8cxcFsaEeWvZxNAB4Sa3mb9mkK9Qiqn2VKPNaQkDESjjUdMuBiR56squRBdtyNXoN47zAdrT5CdVxJ2EjEtLp3khUsJgCJWyyU2mbSATc7HbS5uwNDywYSkyyU3eJ6KZRo1JCq7yHSQb4RVZ4NSeCTPF4iJxH1mKy7p7BMqMYhxJpUGzgd3zkubcd1djU1KsjrZPemTs8sp4BnYvH5uRmxADNVHNN9E9ZmGAHRw5UYLyK7t5v93je8VAXnQh7m9vJNgrEBbHBtyZ5shoH4Z7b35hfrPGesdLPoiYibmjtBuGGaXgTAfx8t6ZfwrhaVL3GBTcW2xpKsFzM2ZFu4CWEqyvh4hrZnYbSfiGvX4MURsrHRsbfiiudPynqbSnFXyHaBB3XKhnpuKCkEtUQheLTFQnbjdWuozUYNZAnbggxHnZLqpPtXVUjdtm25wpEo6DUXvRFKNbe9bhcXkn6WotQeUp9NSuyV77cfCeKf28suudPVdnM7emShWNfSptTMpLQBnaABnquxKThiaooV9qAwfQoj6yEuhAR6BriEUsbYqoQqhVZgZGrUhPUQr4A32wT3A8fMWGw1X2BAUuoKkMrXsqFxg9yB3iHLS5QGB9Powx7ZaJob1u6CzbzDn4zs3NTvNQzvunktoPsw9UVj1SkdrLK7doPU7kmM6S8VaT14yM4mubSXENsUJrJ4KjKCNzxmw4xb1BMCwySP9PuD1LNz1N8yBU6gX1o69queS98Fszv2Kpumwrp3qvZgyJv9krA5yyuyXctHoQ8kteHVWuMet7TLzH5j15226jFU8Gi5hkCYfcP8REYVz9RbmR2F67w3rapkdeP3K4eq2MmWpHLAKZCCP9uUeoTiAfS7f2JajcjAFexbZcpURsU3A9ipFhau7jvN4a9Y29WxpSSfvb9Jfwa4ZoyrrLT1um4GafLstfwVhJpmTADJePBJ4SUokNHJyjFgDeV5FnCuwNus5PzXdGmZfviuGnH79LExLbGVXJ6v2u6H2KnQFghAYPm1joKebkSm629B2QXTEMjSnKeBCjtHXushgtTPaKBaNuKJW39rStwaPpySt3A2xdqeb8sWXgJFKFDs5aFq1CuVMdWB2i7EAStY3ycjvG4C8yd6pxEuW5NNr5L7bTaRwc9gvNMaJvdePeZvmXsCXaUMnF54KNuzBMynQDGQCkCrV5bYS57j9Lt53sL93vuhQozA27pAAVwb9UbBcZXzuxdMVp8NTavSQckkaAAH4jspLkX2QRPSXA2RFuX5YbeSGsFMtKxmxFncHNUsfspJA5QPzUTEo8pDapU4tst9rzXQQBi5zUvdcZ2G71G7cW1sAgPD8NTE6cMBJ6SQbms19z12aSRnrkB7CxxbtUEbNuaYBEvWRNNgCFN3KNPCSGM2Yp6SYYUquwFhAeHmyfeEytoQrAabB1NXSZY8TvdMi4cNkXrUqzxna6LVXVWHAzjUrWu1PioAK5b9DLfHtBM7FKVVFVNSTS9FjAGS43xeMxq9FSQASXqty92kUMHDey4sRasVHgQFRp9kMEBNx3qCypexkgDD8gFAennsF3wW6FcFQhenhygAhZGz4TWBUtvJnSYZFVqoNdzigZSwoZNRJotzrqxV18yUUkv4KFCiHBsQka2MSB7dNfnTMSnD7W9kRH8uYEp3J9NjWS3aXZiBsYTeEfGw2HL4uk6SeWNbArwDHDDRrMZHaC4uNFpvodc3JbyMpo7LE3tZ275xr82pjhFAoU5LP4A8G98ifxgr2ojzhs84wwGGNRuHQQdd7h9iWwevWHnrwuw5x4bfAEwJgXBhEzxpJGgxGfKWMRWCuzyYrm6KN7ThGprvpYye5cyn8FzMAGQP9LcFVffifg9Ua8PFnX7oRfH1BuSMPmKC4Zo93F9GeiK5Nr89Szjg3BrddyCBjJbA6JCUcAkctUXoYAm1MGmJzpuUMWPbo3Kd2HDaUuMYUeeK9sZGmznexnhhQcYeFPZjLGZ9GpMFCFAaNfQXCcmxRV5i34LbxT9hEkBZnjRYQWCZLp7Qx4bgha5T8LBBrLztv2tC1J9TuTYN8q6QJX5SsC39eFnV6tBBfoo9tDxtcNm2atGWWM2eFUwoDhAz1TpjfH6yFo14nyxMQKFVgPDEDWX7g8u2L5BieF9NhazyixCwgsJNUEGAKedQsR6spyZAU7QbfcxF88izRJgaWH2tAvkJ7zkBjkoLkhGWcJzjoR1sabxriUt3KFn7NNJfUhZ3FVn3EY2PeM15RVD7ng1nih79DAneG1sLAbcPesHdmJVxCCndt8x8MH3J6My8pYR5xCAz6JL1d6AJrXAn14q4zvQbLNTxFSi8KVCX6wWLqNYeGHeCuMJFDNfXaJqUiUkxM4tJERxYZqHAtcXvfax26ZWe8FniXAxGfvTZQUh1JX6UTk6rnkVpiDe294Bx8HGYK4CiprQB5TXQ53FAu8RbgYsZPBNv9q2rHxnQ2MBwJY9yRuHvn4rQb3Nfmyei2zoAiLcYwNyJ22aS9buxYE6PX22ZJLomBvnJFrs9AxY4zaxSLrssDYuDPJB2JfEivPBU3nsT8H3G3ii79tF5m9CSz3RjA1Z3nc9DMmHhScbvK8scv7d7o43MfFhK1cvrk6fY5FzgPnzftyiS4tvGCfkZp3PzXrwf56sdUsQUZA9ucT3rBEbFh1YUtLwqFeE8ZgWsx1992wHc65DxvLqB3ZQLywikfkSwmYeYbUZLChccVc3WYFD82WYJJc5s77cdZSpvqjePjsVqti8vz23yM5epHDi3utrfD73Se75jTP19Trvpi2fmMEY15528EsAWFNMhtCN2Fgp71KR1wA5MorZmLw2ZTt2Nxf9M5i1fFrBtX7VxMYjUqkj4NoXF4SMn1G254DWqeP9P4oA83zRVQHxdHKduvZFxa3rztcidxmJmNampu4MeSNJVCK6ZgYbkkJjLotG9ELpf8zEtwfpx6CLsBeuRAiq5xYWETCLj3aHBMPsEEgp5b3PwMPqXn3rLCqzTbQBsWB19KBU4sFEf7kg5DaSHFUevDNcQJbtnCEupucLZ9b1bSQjziwZsMXNCX13nzUxZFtnFZjS1tRpf5esLJujwseB1wYpbJcGcTXFLpcCpsKNgrWp8VymidvTJ9mjmqkQGB4GQmczLme3gbA31KPVwChtow9JNrZcy3rWZadFCFpcSocAgTNsavkVrgFgxTqFScFfn72n88r3eq4m5V2Zqz3ySekwPy5vsDHZ2CptGAmKzqvbwhGVnM2reYw7Np2upB45fcCHH2uZg4XWcnddcH7mt4heTeuWDEm3zZ934gWb8LuZJGxxKAdYJkmDnrURdMk9rFCd7oezNsmjCgdkyAQyoTrJwLeJ6YMqTgnuTBPnUve9bx1QHheE2TupceVLmVTArhRAzAEcFEesxLyDMm5rNj6WF5wnizwZ8c56oN2pR6cNhtVPWbLUV2TvAK1bEdFFjsMXjsRkUiEN9u2VKx4cg1W19nnjD6rMgyS9BEXaNFo6NzaaPTKowY6rropbNtJwmsJxNqg9y6eJwxme8Y5bJR882pvrHwipTdKRnH7n9FtmKd1AbXRPcwjb73ET7oJNKcqBUGrgUVfDGYfv9fpFbQaZVr6obqDeY7DFHHkDUbe6BmYCR1SnxsBgov5yHsHxze7FQySH9DXV9p649kS3WLJeD3gGKnjHpe33m8JGUeRaJDw6KTpzvjGun7DD5FbZiGUxtCHJCbxma9Ymig9AvgrDNtMRdsVqCaR1kqsytRJSme6AhKDSvJxG8Ss2z725nuWvvLSfUdcnPpF6ZUdhEN9e2ENSshq4QZSKjc5W6unSHv9K7HZ8G9K8weuj8VphzKE7jdTJUi5BKUqEWyGqgfgDC7tCmjKD5YNgRAs1eQKiy4yNrdU4pQ5Yem6KQi3KnWUkvHt72akZqg3srdYzAg1yuWJbozCY4aE4PG5bEHXQQvrFR12hAJhmcvvqA79NvHRotWAoTcMyH3E9wUbEdQyCayet9QtDHoVq6xhDnHt4A8rvc9W2xHHvKUmPzz4TEPgskpwu44QcpP1B8w9ye8Q8ibKP45x4jk9jgbncttrrjaehALoLNLacRqk8D7QUy42KcPiwCsdKNtJJsjYCL2oKmKjCMADT7Y3bx2grwwrScpJ5ctsZn38to4AigPvaff5e9j91E1ev1pxX3JLFzgAc6QThMqnZSaNGqB4FChLTK5TZv5owf8H9rNeSZp6UqcT93svwaN6dsLnDt71uAGi34G8dXw96nT6qHMMSsrJBAdVnSfgrp"
-    )
+    CTRT_META = LazyCtrtMeta("v_option_ctrt")
 
     class FuncIdx(Ctrt.FuncIdx):
         """
@@ -39,6 +48,17 @@ class VOptionCtrt(Ctrt):
         EXECUTE = 4
         COLLECT = 5
 
+    _FUNC_UNLOCK = FuncIdx.UNLOCK
+    _FUNC_EXECUTE = FuncIdx.EXECUTE
+    _FUNC_COLLECT = FuncIdx.COLLECT
+    # The functions that take only an amount and hence can be batched,
+    # mapped to the unit property that scales their amount.
+    _BATCH_FUNC_UNITS = {
+        FuncIdx.UNLOCK: "target_tok_unit",
+        FuncIdx.EXECUTE: "target_tok_unit",
+        FuncIdx.COLLECT: "option_tok_unit",
+    }
+
     class StateVar(Ctrt.StateVar):
         """
         StateVar is the enum class for state variables of a contract.
@@ -75,6 +95,8 @@ class VOptionCtrt(Ctrt):
         DBKey is the class for DB key of a contract used to query data.
         """
 
+        __slots__ = ()
+
         # state var.
         @classmethod
         def for_maker(cls) -> VOptionCtrt.DBKey:
@@ -318,6 +340,8 @@ class VOptionCtrt(Ctrt):
         """
         self._ctrt_id = md.CtrtID(ctrt_id)
         self._chain = chain
+        # The contract ID is the same for every function call, so it is bound once.
+        self._exec_req = functools.partial(tx.ExecCtrtFuncTxReq, self._ctrt_id)
 
         self._base_tok_id: Optional[md.TokenID] = None
         self._target_tok_id: Optional[md.TokenID] = None
@@ -335,6 +359,8 @@ class VOptionCtrt(Ctrt):
         self._price: Optional[md.Token] = None
         self._price_unit: Optional[md.Token] = None
 
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+
     @property
     async def maker(self) -> md.Addr:
         """
@@ -432,7 +458,7 @@ class VOptionCtrt(Ctrt):
         Returns:
             BaseTokCtrt: The token contract intance.
         """
-        if not self._base_tok_ctrt:
+        if not self._option_tok_ctrt:
             option_tok_id = await self.option_token_id
             self._option_tok_ctrt = await tcf.from_tok_id(option_tok_id, self.chain)
         return self._option_tok_ctrt
@@ -573,45 +599,53 @@ class VOptionCtrt(Ctrt):
     async def base_tok_unit(self) -> int:
         """
         base_tok_unit queries & return the unit of base token.
+        The unit never changes once the contract is registered, so it is queried only once.
 
         Returns:
             int: The unit of base token.
         """
-        tc = await self.base_tok_ctrt
-        return await tc.unit
+        return await self._cached_unit(
+            "base", lambda: self._tok_unit_of(self.base_tok_ctrt)
+        )
 
     @property
     async def target_tok_unit(self) -> int:
         """
         target_tok_unit queries & return the unit of target token.
+        The unit never changes once the contract is registered, so it is queried only once.
 
         Returns:
             int: The unit of target token.
         """
-        tc = await self.target_tok_ctrt
-        return await tc.unit
+        return await self._cached_unit(
+            "target", lambda: self._tok_unit_of(self.target_tok_ctrt)
+        )
 
     @property
     async def option_tok_unit(self) -> int:
         """
         option_tok_unit queries & return the unit of option token.
+        The unit never changes once the contract is registered, so it is queried only once.
 
         Returns:
             int: The unit of option token.
         """
-        tc = await self.option_tok_ctrt
-        return await tc.unit
+        return await self._cached_unit(
+            "option", lambda: self._tok_unit_of(self.option_tok_ctrt)
+        )
 
     @property
     async def proof_tok_unit(self) -> int:
         """
         proof_tok_unit queries & return the unit of proof token.
+        The unit never changes once the contract is registered, so it is queried only once.
 
         Returns:
             int: The unit of proof token.
         """
-        tc = await self.proof_tok_ctrt
-        return await tc.unit
+        return await self._cached_unit(
+            "proof", lambda: self._tok_unit_of(self.proof_tok_ctrt)
+        )
 
     async def get_base_tok_bal(self, addr: str) -> md.Token:
         """
@@ -714,7 +748,7 @@ class VOptionCtrt(Ctrt):
                 fee=md.RegCtrtFee(fee),
             )
         )
-        logger.debug(data)
+        _debug("{}", lambda: data)
         return cls(
             data["contractId"],
             chain=by.chain,
@@ -726,7 +760,7 @@ class VOptionCtrt(Ctrt):
         new_owner: str,
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         supersede transfers the ownership of the contract to another account
 
@@ -737,20 +771,19 @@ class VOptionCtrt(Ctrt):
             fee (int, optional): Execution fee of this tx. Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str,any]: The response returned by the Node API
+            Dict[str, Any]: The response returned by the Node API
         """
 
         data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
+            self._exec_req(
                 func_id=self.FuncIdx.SUPERSEDE,
                 data_stack=de.DataStack(de.Addr(md.Addr(new_owner))),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
+                timestamp=_now(),
+                attachment=_attachment(attachment),
+                fee=_exec_fee(fee),
             )
         )
-        logger.debug(data)
+        _debug("{}", lambda: data)
         return data
 
     async def activate(
@@ -761,7 +794,7 @@ class VOptionCtrt(Ctrt):
         price_unit: Union[int, float],
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         activate activates the V Option contract to store option token and proof token into the pool.
 
@@ -774,24 +807,24 @@ class VOptionCtrt(Ctrt):
             fee (int, optional): Execution fee of this tx. Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str,any]: The response returned by the Node API
+            Dict[str, Any]: The response returned by the Node API
         """
+        option_unit = await self.option_tok_unit
 
         data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
+            self._exec_req(
                 func_id=self.FuncIdx.ACTIVATE,
                 data_stack=de.DataStack(
-                    de.Amount.for_tok_amount(max_issue_num, await self.option_tok_unit),
-                    de.Amount.for_tok_amount(price, await self.option_tok_unit),
-                    de.Amount.for_tok_amount(price_unit, await self.option_tok_unit),
+                    de.Amount.for_tok_amount(max_issue_num, option_unit),
+                    de.Amount.for_tok_amount(price, option_unit),
+                    de.Amount.for_tok_amount(price_unit, option_unit),
                 ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
+                timestamp=_now(),
+                attachment=_attachment(attachment),
+                fee=_exec_fee(fee),
             )
         )
-        logger.debug(data)
+        _debug("{}", lambda: data)
         return data
 
     async def mint(
@@ -800,7 +833,7 @@ class VOptionCtrt(Ctrt):
         amount: Union[int, float],
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         mint locks target tokens into the pool to get option tokens and proof tokens.
 
@@ -811,22 +844,21 @@ class VOptionCtrt(Ctrt):
             fee (int, optional): Execution fee of this tx. Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str,any]: The response returned by the Node API
+            Dict[str, Any]: The response returned by the Node API
         """
 
         data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
+            self._exec_req(
                 func_id=self.FuncIdx.MINT,
                 data_stack=de.DataStack(
                     de.Amount.for_tok_amount(amount, await self.target_tok_unit),
                 ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
+                timestamp=_now(),
+                attachment=_attachment(attachment),
+                fee=_exec_fee(fee),
             )
         )
-        logger.debug(data)
+        _debug("{}", lambda: data)
         return data
 
     async def unlock(
@@ -835,7 +867,8 @@ class VOptionCtrt(Ctrt):
         amount: Union[int, float],
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+        dedup: bool = False,
+    ) -> Dict[str, Any]:
         """
         unlock gets the remaining option tokens and proof tokens from the pool before the execute time.
 
@@ -844,25 +877,16 @@ class VOptionCtrt(Ctrt):
             amount Union[int, float]: The amount.
             attachment (str, optional): The attachment of this action. Defaults to "".
             fee (int, optional): Execution fee of this tx. Defaults to md.ExecCtrtFee.DEFAULT.
+            dedup (bool, optional): Whether to share the tx of an identical call that is still in flight
+                instead of sending another one. Defaults to False.
 
         Returns:
-            Dict[str,any]: The response returned by the Node API
+            Dict[str, Any]: The response returned by the Node API
         """
 
-        data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
-                func_id=self.FuncIdx.UNLOCK,
-                data_stack=de.DataStack(
-                    de.Amount.for_tok_amount(amount, await self.target_tok_unit),
-                ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
-            )
+        return await self._execute_one(
+            by, self._FUNC_UNLOCK, amount, attachment, fee, dedup
         )
-        logger.debug(data)
-        return data
 
     async def execute(
         self,
@@ -870,7 +894,8 @@ class VOptionCtrt(Ctrt):
         amount: Union[int, float],
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+        dedup: bool = False,
+    ) -> Dict[str, Any]:
         """
         execute executes the V Option contract to get target token after execute time.
 
@@ -879,25 +904,16 @@ class VOptionCtrt(Ctrt):
             amount Union[int, float]: The amount.
             attachment (str, optional): The attachment of this action. Defaults to "".
             fee (int, optional): Execution fee of this tx. Defaults to md.ExecCtrtFee.DEFAULT.
+            dedup (bool, optional): Whether to share the tx of an identical call that is still in flight
+                instead of sending another one. Defaults to False.
 
         Returns:
-            Dict[str,any]: The response returned by the Node API
+            Dict[str, Any]: The response returned by the Node API
         """
 
-        data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
-                func_id=self.FuncIdx.EXECUTE,
-                data_stack=de.DataStack(
-                    de.Amount.for_tok_amount(amount, await self.target_tok_unit),
-                ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
-            )
+        return await self._execute_one(
+            by, self._FUNC_EXECUTE, amount, attachment, fee, dedup
         )
-        logger.debug(data)
-        return data
 
     async def collect(
         self,
@@ -905,7 +921,8 @@ class VOptionCtrt(Ctrt):
         amount: Union[int, float],
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+        dedup: bool = False,
+    ) -> Dict[str, Any]:
         """
         collect collects the base tokens or/and target tokens from the pool depending on the amount of proof tokens after execute deadline.
 
@@ -914,22 +931,310 @@ class VOptionCtrt(Ctrt):
             amount Union[int, float]: The amount.
             attachment (str, optional): The attachment of this action. Defaults to "".
             fee (int, optional): Execution fee of this tx. Defaults to md.ExecCtrtFee.DEFAULT.
+            dedup (bool, optional): Whether to share the tx of an identical call that is still in flight
+                instead of sending another one. Defaults to False.
 
         Returns:
-            Dict[str,any]: The response returned by the Node API
+            Dict[str, Any]: The response returned by the Node API
         """
 
-        data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
-                func_id=self.FuncIdx.COLLECT,
+        return await self._execute_one(
+            by, self._FUNC_COLLECT, amount, attachment, fee, dedup
+        )
+
+    async def _execute_one(
+        self,
+        by: acnt.Account,
+        func_id: VOptionCtrt.FuncIdx,
+        amount: Union[int, float],
+        attachment: str,
+        fee: int,
+        dedup: bool,
+    ) -> Dict[str, Any]:
+        """
+        _execute_one sends a single unlock/execute/collect action.
+        With dedup, calls identical to one still in flight await that one's response instead.
+
+        Args:
+            by (acnt.Account): The action taker
+            func_id (VOptionCtrt.FuncIdx): The function index.
+            amount (Union[int, float]): The amount.
+            attachment (str): The attachment of this action.
+            fee (int): Execution fee of this tx.
+            dedup (bool): Whether to share the tx of an identical call in flight.
+
+        Returns:
+            Dict[str, Any]: The response returned by the Node API
+        """
+        if not dedup:
+            data = await self.execute_many(by, [(func_id, amount)], attachment, fee)
+            return data[0]
+
+        key = (by.addr.data, func_id, amount, attachment, fee)
+        fut = self._inflight.get(key)
+        if fut is None:
+            fut = asyncio.ensure_future(
+                self.execute_many(by, [(func_id, amount)], attachment, fee)
+            )
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so that a cancelled caller does not cancel the tx shared with others.
+        data = await asyncio.shield(fut)
+        return data[0]
+
+    async def execute_many(
+        self,
+        by: acnt.Account,
+        funcs: List[Tuple[VOptionCtrt.FuncIdx, Union[int, float]]],
+        attachment: str = "",
+        fee: int = md.ExecCtrtFee.DEFAULT,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        execute_many sends a batch of unlock/execute/collect actions concurrently.
+        The token units needed by the batch are queried once and shared by all the actions.
+
+        Args:
+            by (acnt.Account): The action taker
+            funcs (List[Tuple[VOptionCtrt.FuncIdx, Union[int, float]]]): The pairs of function index & amount.
+                Only FuncIdx.UNLOCK, FuncIdx.EXECUTE & FuncIdx.COLLECT are supported.
+            attachment (str, optional): The attachment of each action. Defaults to "".
+            fee (int, optional): Execution fee of each tx. Defaults to md.ExecCtrtFee.DEFAULT.
+            return_exceptions (bool, optional): Whether to return the exception of a failed action in its place
+                instead of raising it, so that the responses of the other actions are kept. Defaults to False.
+
+        Raises:
+            ValueError: If a function index in funcs is not supported.
+
+        Returns:
+            List[Union[Dict[str, Any], BaseException]]: The responses returned by the Node API in the order of funcs.
+                Exceptions are only included when return_exceptions is True.
+        """
+        tasks = await self.submit_many(by, funcs, attachment, fee)
+        data = await self._gather_txs(tasks, return_exceptions)
+        _debug("{}", lambda: data)
+        return data
+
+    async def submit_many(
+        self,
+        by: acnt.Account,
+        funcs: List[Tuple[VOptionCtrt.FuncIdx, Union[int, float]]],
+        attachment: str = "",
+        fee: int = md.ExecCtrtFee.DEFAULT,
+    ) -> List[asyncio.Task]:
+        """
+        submit_many signs a batch of unlock/execute/collect actions and schedules their broadcasts
+        without waiting for the responses, so that more batches can be submitted in the meantime.
+
+        Args:
+            by (acnt.Account): The action taker
+            funcs (List[Tuple[VOptionCtrt.FuncIdx, Union[int, float]]]): The pairs of function index & amount.
+                Only FuncIdx.UNLOCK, FuncIdx.EXECUTE & FuncIdx.COLLECT are supported.
+            attachment (str, optional): The attachment of each action. Defaults to "".
+            fee (int, optional): Execution fee of each tx. Defaults to md.ExecCtrtFee.DEFAULT.
+
+        Raises:
+            ValueError: If a function index in funcs is not supported.
+
+        Returns:
+            List[asyncio.Task]: The tasks that resolve to the responses returned by the Node API in the order of funcs.
+        """
+        unit_of_func = self._BATCH_FUNC_UNITS
+        func_ids = {func_id for func_id, _ in funcs}
+        for func_id in func_ids - unit_of_func.keys():
+            raise ValueError(f"{func_id} is not supported in a batch")
+
+        unit_props = list({unit_of_func[func_id] for func_id in func_ids})
+        units = await asyncio.gather(*[getattr(self, prop) for prop in unit_props])
+        unit_of_prop = dict(zip(unit_props, units))
+
+        # The clock is read once for the batch. Each request is then offset by its index in
+        # nanoseconds so that identical actions in the batch still get distinct tx IDs.
+        ts = _now().data
+
+        reqs = [
+            self._exec_req(
+                func_id=func_id,
                 data_stack=de.DataStack(
-                    de.Amount.for_tok_amount(amount, await self.option_tok_unit),
+                    de.Amount.for_tok_amount(
+                        amount, unit_of_prop[unit_of_func[func_id]]
+                    ),
                 ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
+                timestamp=_ts(ts + i),
+                attachment=_attachment(attachment),
+                fee=_exec_fee(fee),
             )
+            for i, (func_id, amount) in enumerate(funcs)
+        ]
+        return [by._submit_contract(req) for req in reqs]
+
+
+class SyncVOptionCtrt:
+    """
+    SyncVOptionCtrt is the synchronous facade of VOptionCtrt for scripts that do not run an event loop.
+    All the calls run on one event loop kept by the facade instead of a new loop per asyncio.run.
+    As the HTTP session of a NodeAPI is bound to the loop it is created on, the contract's chain
+    must be created on the same loop. SyncVOptionCtrt.new takes care of that.
+    """
+
+    def __init__(self, ctrt: VOptionCtrt, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Args:
+            ctrt (VOptionCtrt): The V Option contract.
+            loop (asyncio.AbstractEventLoop): The event loop the NodeAPI of the contract's chain is created on.
+        """
+        self._ctrt = ctrt
+        self._loop = loop
+
+    @classmethod
+    def new(
+        cls,
+        ctrt_id: str,
+        host: str,
+        chain_id: ch.ChainID,
+        api_key: Optional[str] = None,
+    ) -> SyncVOptionCtrt:
+        """
+        new creates a NodeAPI & chain on a new event loop and the facade for the given contract on it.
+
+        Args:
+            ctrt_id (str): The id of the contract.
+            host (str): The host of the node(with the port). E.g. http://veldidina.vos.systems:9928
+            chain_id (ch.ChainID): The chain ID.
+            api_key (Optional[str], optional): The API key to that node. Defaults to None.
+
+        Returns:
+            SyncVOptionCtrt: The SyncVOptionCtrt instance.
+        """
+        loop = asyncio.new_event_loop()
+        node_api = loop.run_until_complete(api.NodeAPI.new(host, api_key))
+        chain = ch.Chain(node_api, chain_id)
+        return cls(VOptionCtrt(ctrt_id, chain), loop)
+
+    @property
+    def ctrt(self) -> VOptionCtrt:
+        """
+        ctrt returns the wrapped V Option contract.
+
+        Returns:
+            VOptionCtrt: The V Option contract.
+        """
+        return self._ctrt
+
+    @property
+    def chain(self) -> ch.Chain:
+        """
+        chain returns the chain object of the contract. Accounts acting on the contract should be built on it.
+
+        Returns:
+            ch.Chain: The chain object of the contract.
+        """
+        return self._ctrt.chain
+
+    def unlock(
+        self,
+        by: acnt.Account,
+        amount: Union[int, float],
+        attachment: str = "",
+        fee: int = md.ExecCtrtFee.DEFAULT,
+    ) -> Dict[str, Any]:
+        """
+        unlock is the synchronous version of VOptionCtrt.unlock.
+
+        Args:
+            by (acnt.Account): The action taker
+            amount Union[int, float]: The amount.
+            attachment (str, optional): The attachment of this action. Defaults to "".
+            fee (int, optional): Execution fee of this tx. Defaults to md.ExecCtrtFee.DEFAULT.
+
+        Returns:
+            Dict[str, Any]: The response returned by the Node API
+        """
+        return self._loop.run_until_complete(
+            self._ctrt.unlock(by, amount, attachment, fee)
         )
-        logger.debug(data)
-        return data
+
+    def execute(
+        self,
+        by: acnt.Account,
+        amount: Union[int, float],
+        attachment: str = "",
+        fee: int = md.ExecCtrtFee.DEFAULT,
+    ) -> Dict[str, Any]:
+        """
+        execute is the synchronous version of VOptionCtrt.execute.
+
+        Args:
+            by (acnt.Account): The action taker
+            amount Union[int, float]: The amount.
+            attachment (str, optional): The attachment of this action. Defaults to "".
+            fee (int, optional): Execution fee of this tx. Defaults to md.ExecCtrtFee.DEFAULT.
+
+        Returns:
+            Dict[str, Any]: The response returned by the Node API
+        """
+        return self._loop.run_until_complete(
+            self._ctrt.execute(by, amount, attachment, fee)
+        )
+
+    def collect(
+        self,
+        by: acnt.Account,
+        amount: Union[int, float],
+        attachment: str = "",
+        fee: int = md.ExecCtrtFee.DEFAULT,
+    ) -> Dict[str, Any]:
+        """
+        collect is the synchronous version of VOptionCtrt.collect.
+
+        Args:
+            by (acnt.Account): The action taker
+            amount Union[int, float]: The amount.
+            attachment (str, optional): The attachment of this action. Defaults to "".
+            fee (int, optional): Execution fee of this tx. Defaults to md.ExecCtrtFee.DEFAULT.
+
+        Returns:
+            Dict[str, Any]: The response returned by the Node API
+        """
+        return self._loop.run_until_complete(
+            self._ctrt.collect(by, amount, attachment, fee)
+        )
+
+    def execute_many(
+        self,
+        by: acnt.Account,
+        funcs: List[Tuple[VOptionCtrt.FuncIdx, Union[int, float]]],
+        attachment: str = "",
+        fee: int = md.ExecCtrtFee.DEFAULT,
+    ) -> List[Dict[str, Any]]:
+        """
+        execute_many is the synchronous version of VOptionCtrt.execute_many.
+
+        Args:
+            by (acnt.Account): The action taker
+            funcs (List[Tuple[VOptionCtrt.FuncIdx, Union[int, float]]]): The pairs of function index & amount.
+            attachment (str, optional): The attachment of each action. Defaults to "".
+            fee (int, optional): Execution fee of each tx. Defaults to md.ExecCtrtFee.DEFAULT.
+
+        Returns:
+            List[Dict[str, Any]]: The responses returned by the Node API in the order of funcs.
+        """
+        return self._loop.run_until_complete(
+            self._ctrt.execute_many(by, funcs, attachment, fee)
+        )
+
+    def close(self) -> None:
+        """
+        close closes the NodeAPI of the contract's chain and then the event loop.
+        """
+        if self._loop.is_closed():
+            return
+        self._loop.run_until_complete(self._ctrt.chain.api.close())
+        self._loop.close()
+
+    def __enter__(self) -> SyncVOptionCtrt:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -3,7 +3,10 @@ v_stable_swap_ctrt contains V Stable Swap contract.
 """
 from __future__ import annotations
 import asyncio
-from typing import TYPE_CHECKING, Dict, Union, Optional
+import collections
+import functools
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Union, Optional
 
 from loguru import logger
 
@@ -16,17 +19,44 @@ from py_vsys import data_entry as de
 from py_vsys import tx_req as tx
 from py_vsys import model as md
 from py_vsys.contract import tok_ctrt_factory as tcf
-from . import Ctrt, BaseTokCtrt
+from . import Ctrt, BaseTokCtrt, LazyCtrtMeta, _attachment
+
+# The max number of entries kept by each of the lru caches of the DB key builders.
+_KEY_CACHE_SIZE = 4096
+
+# The payload is only formatted when a sink actually consumes DEBUG records.
+_debug = logger.opt(lazy=True).debug
+
+
+def _exec_ctrt_fee(fee: int) -> md.ExecCtrtFee:
+    """
+    _exec_ctrt_fee wraps the given fee in md.ExecCtrtFee.
+    The default fee is valid by definition, so its validation is skipped.
+
+    Args:
+        fee (int): The execution fee.
+
+    Returns:
+        md.ExecCtrtFee: The fee model.
+    """
+    if isinstance(fee, int) and fee == md.ExecCtrtFee.DEFAULT:
+        return md.ExecCtrtFee.unchecked(fee)
+    return md.ExecCtrtFee(fee)
 
 
 class VStableSwapCtrt(Ctrt):
     """
     VStableSwapCtrt is the class for VSYS V Stable Swap contract.
+    It can keep queried state values in a TTL cache(off by default), which is dropped after each
+    action taken through the same object. Other contracts do not cache their state.
     """
 
-    CTRT_META = md.CtrtMeta.from_b58_str(
-        "HZLV4ATERYD2q2F9eScc6bs6rvz9wo6iLaYmCypkkE8TLrY93hwrHWZyxrptC4XRYXGFnaj9vayunjNC9bw7XaDj63iuFHGcr9hHBNR3jqUtUBBSr5ohUhFn2gwnMusRfnDU4rbffgB51XQYNSp89jWaRnp31pJrukKyPTGFFAR77j6rDd3G8QBFJm4S6dRBXWUgBSQz5YXbYbEKLEyrHSCh2tfLRvTM7i8Jnn1ZDDFQSNLeLExktz1N4gCViooDf9KkEcpFUXRMV5mD9Vmb48Y8REig13NE3g14uK4RW2Mhm81htJE7XnSHdopuZfoG3zwG4JjXNR7E8ndrn6rLcDFWBGan36cyMiGg2piPPnKjFnPWfSA5sttuSZUb5SvnSQJAFWWjS4gUjm2p8eW3ye2o99hy54DNWA3SdmZmvu4dm9Ghs9cLECp7SDwPK8FF8KD51SVz4Cgx39GbTfXbrUTbVMLWzS5pdNmq2owZZgwSEFLNG7z78FXeYMc2Gym2UGSogD2dQJbTBAvD2UbNqMJM2ax4rLApsAw541eTWNvt9qcqrvQwEVkHRvScuYipNv2ohFuCuwHuLnXQCHTWS3AB5jvW9UKsx18aorm7bBZMu268RWiStgo95zjmceE8ipuXaJKVPy9MiMoudiZaTrJAozhoUGMVvG1e3ixrsnDWuBJF2YTAd7wbHrsNes3yFLV59R9UEyNPUhL49ai1KQowsZCXU74Ws3TgZtveGWqp2VGZH2AKgAgCyRYQ7bQSWZXfiyCpu83SEMQ1KVwoN27ZsmFpBZRVvjNVj3Lo9QQpZSfGjPDPbeyzBVUr38C6WgGa46Zx16naAHMx4cdPT9Kph4jhCxfP449trzWQwqV5wP5oa9vidNkkE2FChbs18DZ3y4a696Tt83yGrfK8dfjQz2sfVrbxBNtgnK54mf8R231M3spZsRrYedXSrBSFi8czVULLxYsejN3vvKYyMf69F1hGSRvfj9siBcrvHnSnwiB4m8nsGHLqaKcVxCKv2jD884G2YJpzaVzexmkC55jw6eaf1pMmYWWUGNnatJzxKiRbkGTXNLcrgjyoA3NhRReL7DNBfPL8iM6Tcy8D4iRN4rzwLFskCawoycF4XRPd9E65bcsL98zuywf2944qmSd5kmqab2Q8mFfiYF1j7aHJHxLBJSNvtGHPndzw8AoVmsS3U96v4NUt33q1jxggD8mNimNxU2nRs2eZAaCesMqpCCwHxkzQjRBst6M3MJsmUxT2UWPps2fSXbfcYDbMm5qMJDBuxhXDss1qGHjR49fFPn9hgcHfyTMMi4H8HNx9kqYPBTATRa463NubB63uqQ2PSrrrqeAAPoxpF3UNKKsPni9b25ojD29H7v8te7nyqHBncYWEqsAMHvjmoVo1Rwi3exCp9idoHnzKDCSEXd3U88dNrW1cxLyLYhkpSKGXTfRZfSWtKnrH5oksGpYFn2hdnWD3W8L1mTAF5uPrxBiWGfCUUQSxUQQSdeCBcLtShTaBuaXAb5taKXPUsS9N74ZM14uesv4ULxwLa4iRTRcGnXHvNSZDBYvZmRSPCXzGsWQjkjwWdNSBKXyZSqUAkRvzo9fX1anXG8Zb6RgwE1WuKBnsJYzg4Vta5CNDavESihw7tQzwqHz9Z9ayMCzMeHC65QyA2sZKn3DWmxaazjK9BWZMwHyJZx24RspcfAmiM38Faahw5fMZPpvNupHK4rmT7TtLe94Mj6VPfXSnnZmY6TuApyyNPZqWbjAR3TpCYvvZjewaJSLEHd2Sy98XDinMEZFNExaemGfTsTMmfWorHtoHB5QUbmQyFA1RRfMLwVntdqzbc612BdcSUCpvKGgVGCCAAPS1dHBVYWMebTQ69Ud5UEsymmU7Pra1tKXboqpfPcXit3hCwCyrRJsxp22m11ozFJuzMyvwdQ3uwQvcCSAZbxHxG7diuo2GXW4nBvrn9cyNe3PEPdQdwXN63X9KQyHVLJqqwL4jRsPrTPJ7AX3pZUzqV7i2dzsRRqFrjgEaPShCvNaG1JC3NTxavsUNk8fFEEcXSNSC4qb9uGcVvVFCUENwcCNZnqiy4PXLcDzm4FzNn715TmBPw7ERmTyQcxa6VLFojYxETb5T46u275rrenHnzeuSB9qQ4n9ua8eYW7K6yz4gzaxBsWtDHNq9D9L4WzmzXLJJWroz2pz5qd88pamf8PGUbSJx6ypYZLpNX7SrYyBDdARG8ftq4ijxju7CkaxJ6Pz5qeqsmz2KcuqjGE1oWcfVY7S3RnENDmdjttsUHLWpoEPrQU7Y2CSeNLRvwncWuV2JX2qhvdVmd6hHKv2h3zjkfmrwK7aHSpAGQ182xausQQiXU7XZ4SZcfhbkXKV7Zs3ePxqYhaEfqbZeioxMaxqpEgapzc6FgAafAJ7EAizcxNQt8Dgem1frhtAFTH2WRZLAnBJngbRJDs2usB6Lg8buhkhv2CWtBdYDAwwRBDiRg1AxexLnPgFRCGZDCsgg7Uo93DC3XR443qJWH2JXGvteKPcJX1B4wciQvTUimtQh467e2K6N7CsbiBipWsryTTFn2YXxHm5tUHLjjtYy8YTSNP4MoWjMUCXCf2Y7EfxXtMrchWS31QwVjad5oGZi74TMkXqj1fKo6jN9T1zQxHhjhvQUCUdvExbTaUZbFxfSbf6Dvai8ovFxRvQvSYDsHnGAfHBM9Wt41kXCvR8spEifeHfqibHuNj5W3eDvmWNBrS4ctWX8ak7QksbTf5wPH7BUXHUfpvtk9iFREsy2b97uztH686ctnaSV3aHFqD1YayWTuhVnd69Y2RrDGCNK6QUw3AyLBNZGceEVVrTvWEg8qmThsW8FgEHE5Het4r5fPYdJp4C4Ue6VHFJzXG6G2dkJXaX9bk43EZ3aY4Hi2kqXx3w996ErCzeeiLv3LTZa9Bwcdb5RJHRRfKyz85yZizLdJz5wJNV6pCYEEp2FwHF95GX38cVPMsW7LPFpnZVh8MJEsGZXjcLPdE1Tej8KqxhDP6nQKLsaShjN89nuVvNaYo3wAVnCkDDFv7XnfYWWaQJ5rAHqw8Kcztw39quZ2gJuBxHtRW4ChFQA94bFbYSZHNNcXSi7aYsXLSVVBuDGdcJQWbB5dQUhxc7AFEtHSTvtFLG59UkicVsymqtWYCMmT8rLhQqBJZt6hLNgswhyip6PJhgp2w6aGh74Mvy2hWUmyPJwaMKp94Ue4Az55foq27haWKwZ59MTYYJaoaxHfjdAvqgaC91gwyq6qfYonBHKqk6yoCuiBiD39qc6qZxubsppaYVGDD7MU3KsQpRbrTpqdjjUZ8CmAi3YNcH7nHruP1Nzu5ZVMaMKFZbWD2aVfeTmskQmaFKWpCzL8yrL4fdDLkY2kCBGgK2HBK3zJ84NaM9HbFB6o7WGAjjbAeQnyudkQprWQJ3MFYyiGGb5Y8xTMn7ngLnv63EBmtJF3jGqhHLjcS2rZjDbmrhySLYJWF9Ytf7Q6krdCK76iq3VTXD6S7M6VBxFbZTcgv42w6eJQUCwYfPMwtvJ4KFHRs81QqtrJuQ9xDyX3vB1PjRgXY8w2SPQWrfw2ePKe1tVp9mquVNZ2Lc3wjcERHYFKCjoq3gPu6DE5PVYcbAXXjviUtCUAD1P5VZDK5sqRFa8BaX5eZd85ibuizvTp7oMaAAX9BYRdYekjYc1UK3qui5DnDerxGmd7FQNPGF1zkJdKaFKDGepVty3P9uRNGjgDadLEo7K9vAREUtXcodCeG63rnAQoHmbCo7eETPEA4kyw2Ms9oNg7rckqouSnHjDLwNFzEAQGDRgSsd4UuvVBJ3pJT4ezY3bzxo4VuLq8bm5PMySuKwBZhfJ2z7DKcxgA8U1uoQ1ongJap6Jsp32ESDUfBE52PsVePkbAtbZshQtDbK4sc3Ed1TRHsef1zRk9ayi1XF9yfyTbLyixe36NyGywNsewrkKQ1kuy8WB36m5UzXnh1mhu1WbViSy6KRAMD4bFZZPzwbHLfthP26CmLo5gEihapLEzU1x4QAv7ukGPezdgRjCv7FDv4xPNfyQjap969tfKkx697rBqYPcdZWKSqgq9abxYVbZaLDJbTtKeuDqgAxG95U43TLKt2By5mqi7yY9YNL2QdTueuLRjsLzTAQv45CWhZqxYBMWyBGnmUK7JP2NEw8YAq1HdMDfJCADHdTiDncb1L13ZHtXhunu8Hp5YxqLLdcJQBnsJF17F1R4V5XLnR6aotaDN7RhzqbQR9MirrXZ58d3ZhZLA7BWpZiYHgNkYE39PRY3gUhUMNbxsqbjip1g7ByHkc5FmnnpvEz5pXGGifCGEgFJNybEPkKxhGuxeR9W8uC2BAD8AEnthr3cR21K3RiRWW9KZCX18bV2pxwuYvqL31t6uRVJxGEGy62REYjAa2KZSx1hYBAhmsCGUeaArpL7V5aigYmhssV77C5DzvUCEAZpGP5rc9QESn62sJbKXMNNjAFpJcqsbGhVgkrdFzLfgQSh4NhavHxD8aGpmurgGez39y4ToQAJxN1xLpfDKqcVRE2kGD3biwiuCY5uXhPqgc7n8R4sqNTHr5ov14VtbYcYZYfZUaT2UMdUEq4RvcRHdK5LvPujcwbJd17CcjLCANXFEyakUz5aGCZPKm6vqc9VLeuJyxvT2hgG6Cn66f7vR9GoKt7FPnZTfh3TG84qK7T3XtT61qoNdUEnEAdKoxecs6hdCW3BBaouqnsqJqt4ra4cib4xXRSh4khTa3LdKxmp2Fjpa1nAj2peiTcNzsYq5Rpum8eynpN968zQQFW5dmFqXGDdZHdyuDtnRDXZoUwEggf1FpVXGU55oWP9LdfKDVGtBMmgh85zZ7X3tAyfVFj6iS6FfUyj7dVSpzH9haRghQpS1ikWEE9ukUzr4Ear5UPKykPmRrXLsy2Zr2V6k9nKRSfyHp6xZ56L4muGMdNeFRvuMMu2UAoENuVuYrRduupHqD133geUH2zNZrBe9bwCqAZHk1GgHxAUJwB3KiT2sZeNvBfR1vfPYmYUBvoRduy74VpatD3DXDjdXTczT2ezj8qdDLD3TuFjun6e8r8NMBn2ChGH5bfyF3NW9xzkZnnzFpcFdTe7sfqC5GkFaijRuG2p98GPkphFqrhznPLwv7brMTsjTqbTsw5NkdVyoVcKLguBoFkRu643rQpTWwjtz87pi9PVUFv7bhDZJhVnU1Z1eReTJWacgAwsPJLxj5Jh9P1vDPR9EaBoffVdQKEB3G"
-    )
+    CTRT_META = LazyCtrtMeta("v_stable_swap_ctrt")
+
+    # The seconds a queried state value is kept for. 0 disables the state cache.
+    STATE_CACHE_TTL: float = 0
+    # The max number of state values kept per contract object.
+    STATE_CACHE_SIZE: int = 2048
 
     class FuncIdx(Ctrt.FuncIdx):
         """
@@ -78,8 +108,27 @@ class VStableSwapCtrt(Ctrt):
     class DBKey(Ctrt.DBKey):
         """
         DBKey is the class for DB key of a contract used to query data.
+        The keys are built once per argument and reused for the later queries.
         """
 
+        __slots__ = ()
+
+        @classmethod
+        @functools.lru_cache(maxsize=None)
+        def _for_state_var(
+            cls, state_var: VStableSwapCtrt.StateVar
+        ) -> VStableSwapCtrt.DBKey:
+            """
+            _for_state_var returns the VStableSwapCtrt.DBKey object for querying the given state variable.
+
+            Args:
+                state_var (VStableSwapCtrt.StateVar): The state variable.
+
+            Returns:
+                VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
+            """
+            return cls(state_var.serialize())
+
         # state var.
         @classmethod
         def for_maker(cls) -> VStableSwapCtrt.DBKey:
@@ -89,8 +138,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateVar.MAKER.serialize()
-            return cls(b)
+            return cls._for_state_var(VStableSwapCtrt.StateVar.MAKER)
 
         @classmethod
         def for_base_token_id(cls) -> VStableSwapCtrt.DBKey:
@@ -100,8 +148,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateVar.BASE_TOKEN_ID.serialize()
-            return cls(b)
+            return cls._for_state_var(VStableSwapCtrt.StateVar.BASE_TOKEN_ID)
 
         @classmethod
         def for_target_token_id(cls) -> VStableSwapCtrt.DBKey:
@@ -111,8 +158,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateVar.TARGET_TOKEN_ID.serialize()
-            return cls(b)
+            return cls._for_state_var(VStableSwapCtrt.StateVar.TARGET_TOKEN_ID)
 
         @classmethod
         def for_max_order_per_user(cls) -> VStableSwapCtrt.DBKey:
@@ -122,8 +168,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateVar.MAX_ORDER_PER_USER.serialize()
-            return cls(b)
+            return cls._for_state_var(VStableSwapCtrt.StateVar.MAX_ORDER_PER_USER)
 
         @classmethod
         def for_base_price_unit(cls) -> VStableSwapCtrt.DBKey:
@@ -133,8 +178,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateVar.UNIT_PRICE_BASE.serialize()
-            return cls(b)
+            return cls._for_state_var(VStableSwapCtrt.StateVar.UNIT_PRICE_BASE)
 
         @classmethod
         def for_target_price_unit(cls) -> VStableSwapCtrt.DBKey:
@@ -144,11 +188,28 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateVar.UNIT_PRICE_TARGET.serialize()
-            return cls(b)
+            return cls._for_state_var(VStableSwapCtrt.StateVar.UNIT_PRICE_TARGET)
 
         # state map.
+        @staticmethod
+        @functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
+        def _addr_entry(addr: str) -> de.Addr:
+            """
+            _addr_entry returns the de.Addr object of the given address.
+            It is shared by the address-keyed builders so that an address is decoded & validated once.
+            Each builder caches its own keys, but an address shows up in several of them, so this cache
+            still saves the decoding the first time each builder sees the address.
+
+            Args:
+                addr (str): The address.
+
+            Returns:
+                de.Addr: The de.Addr object.
+            """
+            return de.Addr(md.Addr(addr))
+
         @classmethod
+        @functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
         def for_base_token_balance(cls, addr: str) -> VStableSwapCtrt.DBKey:
             """
             for_base_token_balance returns the VStableSwapCtrt.DBKey object for querying the base token balance.
@@ -161,11 +222,12 @@ class VStableSwapCtrt(Ctrt):
             """
             b = VStableSwapCtrt.StateMap(
                 idx=VStableSwapCtrt.StateMapIdx.BASE_TOKEN_BALANCE,
-                data_entry=de.Addr(md.Addr(addr)),
+                data_entry=cls._addr_entry(addr),
             ).serialize()
             return cls(b)
 
         @classmethod
+        @functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
         def for_target_token_balance(cls, addr: str) -> VStableSwapCtrt.DBKey:
             """
             for_target_token_balance returns the VStableSwapCtrt.DBKey object for querying the target token balance.
@@ -178,11 +240,12 @@ class VStableSwapCtrt(Ctrt):
             """
             b = VStableSwapCtrt.StateMap(
                 idx=VStableSwapCtrt.StateMapIdx.TARGET_TOKEN_BALANCE,
-                data_entry=de.Addr(md.Addr(addr)),
+                data_entry=cls._addr_entry(addr),
             ).serialize()
             return cls(b)
 
         @classmethod
+        @functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
         def for_user_orders(cls, addr: str) -> VStableSwapCtrt.DBKey:
             """
             for_user_orders returns the VStableSwapCtrt.DBKey object for querying the number of orders of the user's.
@@ -195,27 +258,62 @@ class VStableSwapCtrt(Ctrt):
             """
             b = VStableSwapCtrt.StateMap(
                 idx=VStableSwapCtrt.StateMapIdx.USER_ORDERS,
-                data_entry=de.Addr(md.Addr(addr)),
+                data_entry=cls._addr_entry(addr),
             ).serialize()
             return cls(b)
 
+        @staticmethod
+        @functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
+        def _order_entry(order_id: str) -> de.Bytes:
+            """
+            _order_entry returns the de.Bytes object of the given order id.
+            It is shared by the order key builders so that an order id is base58 decoded once.
+            _for_order caches one key per (state map, order id) pair, and each order has 12 state maps,
+            so this cache still saves the decoding for the first query of each other state map of the order.
+
+            Args:
+                order_id (str): The order id.
+
+            Returns:
+                de.Bytes: The de.Bytes object.
+            """
+            return de.Bytes.from_base58_str(order_id)
+
         @classmethod
-        def for_order_owner(cls, order_id: str) -> VStableSwapCtrt.DBKey:
+        @functools.lru_cache(maxsize=_KEY_CACHE_SIZE)
+        def _for_order(
+            cls, idx: VStableSwapCtrt.StateMapIdx, order_id: str
+        ) -> VStableSwapCtrt.DBKey:
             """
-            for_order_owner returns the VStableSwapCtrt.DBKey object for querying the order owner.
+            _for_order returns the VStableSwapCtrt.DBKey object for querying the given state map of the order.
+            The order state maps differ only in the index, so all the for_* order key builders share it.
 
             Args:
+                idx (VStableSwapCtrt.StateMapIdx): The state map index.
                 order_id (str): The order id.
 
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
             b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.ORDER_OWNER,
-                data_entry=de.Bytes.from_base58_str(order_id),
+                idx=idx,
+                data_entry=cls._order_entry(order_id),
             ).serialize()
             return cls(b)
 
+        @classmethod
+        def for_order_owner(cls, order_id: str) -> VStableSwapCtrt.DBKey:
+            """
+            for_order_owner returns the VStableSwapCtrt.DBKey object for querying the order owner.
+
+            Args:
+                order_id (str): The order id.
+
+            Returns:
+                VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
+            """
+            return cls._for_order(VStableSwapCtrt.StateMapIdx.ORDER_OWNER, order_id)
+
         @classmethod
         def for_fee_base(cls, order_id: str) -> VStableSwapCtrt.DBKey:
             """
@@ -227,11 +325,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.FEE_BASE,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(VStableSwapCtrt.StateMapIdx.FEE_BASE, order_id)
 
         @classmethod
         def for_fee_target(cls, order_id: str) -> VStableSwapCtrt.DBKey:
@@ -244,11 +338,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.FEE_TARGET,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(VStableSwapCtrt.StateMapIdx.FEE_TARGET, order_id)
 
         @classmethod
         def for_min_base(cls, order_id: str) -> VStableSwapCtrt.DBKey:
@@ -261,11 +351,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.MIN_BASE,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(VStableSwapCtrt.StateMapIdx.MIN_BASE, order_id)
 
         @classmethod
         def for_max_base(cls, order_id: str) -> VStableSwapCtrt.DBKey:
@@ -278,11 +364,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.MAX_BASE,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(VStableSwapCtrt.StateMapIdx.MAX_BASE, order_id)
 
         @classmethod
         def for_min_target(cls, order_id: str) -> VStableSwapCtrt.DBKey:
@@ -295,11 +377,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.MIN_TARGET,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(VStableSwapCtrt.StateMapIdx.MIN_TARGET, order_id)
 
         @classmethod
         def for_max_target(cls, order_id: str) -> VStableSwapCtrt.DBKey:
@@ -312,11 +390,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.MAX_TARGET,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(VStableSwapCtrt.StateMapIdx.MAX_TARGET, order_id)
 
         @classmethod
         def for_price_base(cls, order_id: str) -> VStableSwapCtrt.DBKey:
@@ -329,11 +403,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.PRICE_BASE,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(VStableSwapCtrt.StateMapIdx.PRICE_BASE, order_id)
 
         @classmethod
         def for_price_target(cls, order_id: str) -> VStableSwapCtrt.DBKey:
@@ -346,11 +416,7 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.PRICE_TARGET,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(VStableSwapCtrt.StateMapIdx.PRICE_TARGET, order_id)
 
         @classmethod
         def for_base_token_locked(cls, order_id: str) -> VStableSwapCtrt.DBKey:
@@ -363,11 +429,9 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.BASE_TOKEN_LOCKED,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(
+                VStableSwapCtrt.StateMapIdx.BASE_TOKEN_LOCKED, order_id
+            )
 
         @classmethod
         def for_target_token_locked(cls, order_id: str) -> VStableSwapCtrt.DBKey:
@@ -380,11 +444,9 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.TARGET_TOKEN_LOCKED,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(
+                VStableSwapCtrt.StateMapIdx.TARGET_TOKEN_LOCKED, order_id
+            )
 
         @classmethod
         def for_order_status(cls, order_id: str) -> VStableSwapCtrt.DBKey:
@@ -397,11 +459,47 @@ class VStableSwapCtrt(Ctrt):
             Returns:
                 VStableSwapCtrt.DBKey: The VStableSwapCtrt.DBKey object.
             """
-            b = VStableSwapCtrt.StateMap(
-                idx=VStableSwapCtrt.StateMapIdx.ORDER_STATUS,
-                data_entry=de.Bytes.from_base58_str(order_id),
-            ).serialize()
-            return cls(b)
+            return cls._for_order(VStableSwapCtrt.StateMapIdx.ORDER_STATUS, order_id)
+
+    # The fields of an order returned by get_order.
+    # Each one comes with the name of its DB key builder & the name of its unit(None for non-token values).
+    _ORDER_FIELDS = (
+        ("owner", "for_order_owner", None),
+        ("fee_base", "for_fee_base", "base_tok_unit"),
+        ("fee_target", "for_fee_target", "target_tok_unit"),
+        ("min_base", "for_min_base", "base_tok_unit"),
+        ("max_base", "for_max_base", "base_tok_unit"),
+        ("min_target", "for_min_target", "target_tok_unit"),
+        ("max_target", "for_max_target", "target_tok_unit"),
+        ("price_base", "for_price_base", "base_price_unit"),
+        ("price_target", "for_price_target", "target_price_unit"),
+        ("base_tok_locked", "for_base_token_locked", "base_tok_unit"),
+        ("target_tok_locked", "for_target_token_locked", "target_tok_unit"),
+        ("status", "for_order_status", None),
+    )
+    _ORDER_UNITS = (
+        "base_tok_unit",
+        "target_tok_unit",
+        "base_price_unit",
+        "target_price_unit",
+    )
+
+    class SetOrderParams(NamedTuple):
+        """
+        SetOrderParams is the class for the parameters of an order to set.
+        The fields are in the order of the arguments of set_order.
+        """
+
+        fee_base: Union[int, float]
+        fee_target: Union[int, float]
+        min_base: Union[int, float]
+        max_base: Union[int, float]
+        min_target: Union[int, float]
+        max_target: Union[int, float]
+        price_base: Union[int, float]
+        price_target: Union[int, float]
+        base_deposit: Union[int, float]
+        target_deposit: Union[int, float]
 
     def __init__(self, ctrt_id: str, chain: ch.Chain) -> None:
         """
@@ -418,6 +516,104 @@ class VStableSwapCtrt(Ctrt):
         self._base_tok_ctrt: Optional[BaseTokCtrt] = None
         self._target_tok_ctrt: Optional[BaseTokCtrt] = None
 
+    @property
+    def _state_cache(self) -> collections.OrderedDict:
+        """
+        _state_cache returns the LRU cache of the queried state values of the contract.
+        It maps the bytes of a DB key to the tuple of (expiry time, value).
+        The cache is created on the first use.
+
+        Returns:
+            collections.OrderedDict: The cache.
+        """
+        try:
+            return self.__dict__["_state_cache"]
+        except KeyError:
+            cache = self.__dict__["_state_cache"] = collections.OrderedDict()
+            return cache
+
+    def invalidate_cache(self) -> None:
+        """
+        invalidate_cache drops all the cached state values of the contract.
+        It is called after each action taken through this object. Call it after the state is changed
+        elsewhere(e.g. a token deposit made through the token contract).
+        """
+        self._state_cache.clear()
+
+    async def _query_db_key(
+        self, db_key: Ctrt.DBKey, value_type: Optional[type] = None
+    ) -> Any:
+        """
+        _query_db_key queries the data by the given db_key.
+        If STATE_CACHE_TTL is positive, the value is served from the state cache while it is fresh.
+
+        Args:
+            db_key (Ctrt.DBKey): The db key.
+            value_type (Optional[type], optional): The type to convert the result to. E.g. bool.
+                Defaults to None, which means the result is returned as is.
+
+        Returns:
+            Any: The result.
+        """
+        if self.STATE_CACHE_TTL <= 0:
+            return await super()._query_db_key(db_key, value_type)
+
+        cache = self._state_cache
+        key = db_key.data
+        now = time.monotonic()
+
+        hit = cache.get(key)
+        if hit is not None and hit[0] > now:
+            cache.move_to_end(key)
+            return self._as_type(hit[1], value_type)
+
+        val = await self._fetch_db_key(db_key)
+        cache[key] = (now + self.STATE_CACHE_TTL, val)
+        cache.move_to_end(key)
+        while len(cache) > self.STATE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return self._as_type(val, value_type)
+
+    async def _query_db_keys(self, db_keys: List[Ctrt.DBKey]) -> List[Any]:
+        """
+        _query_db_keys queries the data by each of the given db_keys in one batch.
+        If STATE_CACHE_TTL is positive, fresh values in the state cache are reused and only the rest are queried.
+
+        Args:
+            db_keys (List[Ctrt.DBKey]): The db keys.
+
+        Returns:
+            List[Any]: The results in the same order as db_keys.
+        """
+        if self.STATE_CACHE_TTL <= 0:
+            return await super()._query_db_keys(db_keys)
+
+        cache = self._state_cache
+        now = time.monotonic()
+
+        vals: List[Any] = [None] * len(db_keys)
+        misses = []
+        for i, db_key in enumerate(db_keys):
+            hit = cache.get(db_key.data)
+            if hit is not None and hit[0] > now:
+                vals[i] = hit[1]
+            else:
+                misses.append(i)
+
+        if not misses:
+            return vals
+
+        fetched = await super()._query_db_keys([db_keys[i] for i in misses])
+
+        expiry = now + self.STATE_CACHE_TTL
+        for i, val in zip(misses, fetched):
+            vals[i] = val
+            cache[db_keys[i].data] = (expiry, val)
+            cache.move_to_end(db_keys[i].data)
+        while len(cache) > self.STATE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return vals
+
     @property
     async def maker(self) -> md.Addr:
         """
@@ -485,23 +681,27 @@ class VStableSwapCtrt(Ctrt):
     async def base_tok_unit(self) -> int:
         """
         base_tok_unit queries & return the unit of base token.
+        The unit never changes once the contract is registered, so it is queried only once.
 
         Returns:
             int: The unit of base token.
         """
-        tc = await self.base_tok_ctrt
-        return await tc.unit
+        return await self._cached_unit(
+            "base_tok", lambda: self._tok_unit_of(self.base_tok_ctrt)
+        )
 
     @property
     async def target_tok_unit(self) -> int:
         """
         target_tok_unit queries & return the unit of target token.
+        The unit never changes once the contract is registered, so it is queried only once.
 
         Returns:
             int: The unit of target token.
         """
-        tc = await self.target_tok_ctrt
-        return await tc.unit
+        return await self._cached_unit(
+            "target_tok", lambda: self._tok_unit_of(self.target_tok_ctrt)
+        )
 
     @property
     async def max_order_per_user(self) -> int:
@@ -517,21 +717,28 @@ class VStableSwapCtrt(Ctrt):
     async def base_price_unit(self) -> int:
         """
         base_price_unit queries & returns the price unit of base token.
+        It is set when the contract is registered, so it is queried only once.
 
         Returns:
             int: the price unit of base token.
         """
-        return await self._query_db_key(self.DBKey.for_base_price_unit())
+        return await self._cached_unit(
+            "base_price", lambda: self._query_db_key(self.DBKey.for_base_price_unit())
+        )
 
     @property
     async def target_price_unit(self) -> int:
         """
         target_price_unit queries & returns the price unit of target token.
+        It is set when the contract is registered, so it is queried only once.
 
         Returns:
             int: the price unit of target token.
         """
-        return await self._query_db_key(self.DBKey.for_target_price_unit())
+        return await self._cached_unit(
+            "target_price",
+            lambda: self._query_db_key(self.DBKey.for_target_price_unit()),
+        )
 
     async def get_base_tok_bal(self, addr: str) -> md.Token:
         """
@@ -543,8 +750,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The balance of the token.
         """
-        raw_val = await self._query_db_key(self.DBKey.for_base_token_balance(addr))
-        return md.Token(raw_val, await self.base_tok_unit)
+        raw_val, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_base_token_balance(addr)),
+            self.base_tok_unit,
+        )
+        return md.Token(raw_val, unit)
 
     async def get_target_tok_bal(self, addr: str) -> md.Token:
         """
@@ -556,8 +766,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The balance of the token.
         """
-        raw_val = await self._query_db_key(self.DBKey.for_target_token_balance(addr))
-        return md.Token(raw_val, await self.target_tok_unit)
+        raw_val, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_target_token_balance(addr)),
+            self.target_tok_unit,
+        )
+        return md.Token(raw_val, unit)
 
     async def get_user_orders(self, addr: str) -> int:
         """
@@ -594,8 +807,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The fee for base token..
         """
-        fee_base = await self._query_db_key(self.DBKey.for_fee_base(order_id))
-        return md.Token(fee_base, await self.base_tok_unit)
+        fee_base, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_fee_base(order_id)),
+            self.base_tok_unit,
+        )
+        return md.Token(fee_base, unit)
 
     async def get_fee_target(self, order_id: str) -> md.Token:
         """
@@ -607,8 +823,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The target fee.
         """
-        target_base = await self._query_db_key(self.DBKey.for_fee_target(order_id))
-        return md.Token(target_base, await self.target_tok_unit)
+        target_base, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_fee_target(order_id)),
+            self.target_tok_unit,
+        )
+        return md.Token(target_base, unit)
 
     async def get_min_base(self, order_id: str) -> md.Token:
         """
@@ -620,8 +839,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The minimum amount of base token.
         """
-        min_base = await self._query_db_key(self.DBKey.for_min_base(order_id))
-        return md.Token(min_base, await self.base_tok_unit)
+        min_base, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_min_base(order_id)),
+            self.base_tok_unit,
+        )
+        return md.Token(min_base, unit)
 
     async def get_max_base(self, order_id: str) -> md.Token:
         """
@@ -633,8 +855,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The maximum amount of base token.
         """
-        max_base = await self._query_db_key(self.DBKey.for_max_base(order_id))
-        return md.Token(max_base, await self.base_tok_unit)
+        max_base, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_max_base(order_id)),
+            self.base_tok_unit,
+        )
+        return md.Token(max_base, unit)
 
     async def get_min_target(self, order_id: str) -> md.Token:
         """
@@ -646,8 +871,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The minimum amount of target token.
         """
-        min_target = await self._query_db_key(self.DBKey.for_min_target(order_id))
-        return md.Token(min_target, await self.target_tok_unit)
+        min_target, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_min_target(order_id)),
+            self.target_tok_unit,
+        )
+        return md.Token(min_target, unit)
 
     async def get_max_target(self, order_id: str) -> md.Token:
         """
@@ -659,8 +887,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The maximum amount of target token.
         """
-        max_target = await self._query_db_key(self.DBKey.for_max_target(order_id))
-        return md.Token(max_target, await self.target_tok_unit)
+        max_target, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_max_target(order_id)),
+            self.target_tok_unit,
+        )
+        return md.Token(max_target, unit)
 
     async def get_price_base(self, order_id: str) -> md.Token:
         """
@@ -672,8 +903,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Addr: The price of the base token.
         """
-        price_base = await self._query_db_key(self.DBKey.for_price_base(order_id))
-        return md.Token(price_base, await self.base_price_unit)
+        price_base, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_price_base(order_id)),
+            self.base_price_unit,
+        )
+        return md.Token(price_base, unit)
 
     async def get_price_target(self, order_id: str) -> md.Token:
         """
@@ -685,8 +919,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The price of the target token.
         """
-        price_target = await self._query_db_key(self.DBKey.for_price_target(order_id))
-        return md.Token(price_target, await self.target_price_unit)
+        price_target, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_price_target(order_id)),
+            self.target_price_unit,
+        )
+        return md.Token(price_target, unit)
 
     async def get_base_tok_locked(self, order_id: str) -> md.Token:
         """
@@ -698,8 +935,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The balance of locked base token.
         """
-        raw_val = await self._query_db_key(self.DBKey.for_base_token_locked(order_id))
-        return md.Token(raw_val, await self.base_tok_unit)
+        raw_val, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_base_token_locked(order_id)),
+            self.base_tok_unit,
+        )
+        return md.Token(raw_val, unit)
 
     async def get_target_tok_locked(self, order_id: str) -> md.Token:
         """
@@ -711,8 +951,11 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             md.Token: The balance of locked target token.
         """
-        raw_val = await self._query_db_key(self.DBKey.for_target_token_locked(order_id))
-        return md.Token(raw_val, await self.target_tok_unit)
+        raw_val, unit = await asyncio.gather(
+            self._query_db_key(self.DBKey.for_target_token_locked(order_id)),
+            self.target_tok_unit,
+        )
+        return md.Token(raw_val, unit)
 
     async def get_order_status(self, order_id: str) -> bool:
         """
@@ -724,8 +967,65 @@ class VStableSwapCtrt(Ctrt):
         Returns:
             bool: The order status.
         """
-        status = await self._query_db_key(self.DBKey.for_order_status(order_id))
-        return status == "true"
+        return await self._query_db_key(
+            self.DBKey.for_order_status(order_id), value_type=bool
+        )
+
+    async def get_order(self, order_id: str) -> Dict[str, Any]:
+        """
+        get_order queries & returns all the fields of the order.
+        The fields are queried concurrently.
+
+        Args:
+            order_id (str): The order id.
+
+        Returns:
+            Dict[str, Any]: The fields of the order keyed by name.
+                E.g. "owner" => md.Addr, "fee_base" => md.Token, "status" => bool.
+        """
+        orders = await self.get_orders((order_id,))
+        return orders[0]
+
+    async def get_orders(self, order_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        get_orders queries & returns all the fields of the given orders.
+        The fields of all the orders are queried concurrently in one go.
+
+        Args:
+            order_ids (Iterable[str]): The order ids.
+
+        Returns:
+            List[Dict[str, Any]]: The fields of each order in the same order as order_ids.
+                See get_order for the fields.
+        """
+        order_ids = list(order_ids)
+        keys = [
+            getattr(self.DBKey, builder)(order_id)
+            for order_id in order_ids
+            for _, builder, _ in self._ORDER_FIELDS
+        ]
+
+        n_units = len(self._ORDER_UNITS)
+        res = await asyncio.gather(
+            *[getattr(self, name) for name in self._ORDER_UNITS],
+            self._query_db_keys(keys),
+        )
+        units = dict(zip(self._ORDER_UNITS, res[:n_units]))
+        vals = iter(res[n_units])
+
+        orders = []
+        for _ in order_ids:
+            order = {}
+            for name, _, unit_name in self._ORDER_FIELDS:
+                val = next(vals)
+                if unit_name is not None:
+                    order[name] = md.Token(val, units[unit_name])
+                elif name == "owner":
+                    order[name] = md.Addr(val)
+                else:
+                    order[name] = self._as_type(val, bool)
+            orders.append(order)
+        return orders
 
     @classmethod
     async def register(
@@ -760,9 +1060,9 @@ class VStableSwapCtrt(Ctrt):
                 data_stack=de.DataStack(
                     de.TokenID(md.TokenID(base_tok_id)),
                     de.TokenID(md.TokenID(target_tok_id)),
-                    de.Amount(md.Int(max_order_per_user)),
-                    de.Amount(md.Int(base_price_unit)),
-                    de.Amount(md.Int(target_price_unit)),
+                    de.Amount.of(max_order_per_user),
+                    de.Amount.of(base_price_unit),
+                    de.Amount.of(target_price_unit),
                 ),
                 ctrt_meta=cls.CTRT_META,
                 timestamp=md.VSYSTimestamp.now(),
@@ -770,19 +1070,54 @@ class VStableSwapCtrt(Ctrt):
                 fee=md.RegCtrtFee(fee),
             )
         )
-        logger.debug(data)
+        _debug("{}", lambda: data)
         return cls(
             data["contractId"],
             chain=by.chain,
         )
 
+    async def _exec(
+        self,
+        by: acnt.Account,
+        func_id: VStableSwapCtrt.FuncIdx,
+        data_stack: de.DataStack,
+        attachment: str,
+        fee: int,
+    ) -> Dict[str, Any]:
+        """
+        _exec sends an execute contract transaction that calls the given function of the contract.
+
+        Args:
+            by (acnt.Account): The action taker.
+            func_id (VStableSwapCtrt.FuncIdx): The function index.
+            data_stack (de.DataStack): The data stack of the function.
+            attachment (str): The attachment of this action.
+            fee (int): Execution fee of this tx.
+
+        Returns:
+            Dict[str, Any]: The response returned by the Node API.
+        """
+        data = await by._execute_contract(
+            tx.ExecCtrtFuncTxReq(
+                ctrt_id=self._ctrt_id,
+                func_id=func_id,
+                data_stack=data_stack,
+                timestamp=md.VSYSTimestamp.now(),
+                attachment=_attachment(attachment),
+                fee=_exec_ctrt_fee(fee),
+            )
+        )
+        self.invalidate_cache()
+        _debug("{}", lambda: data)
+        return data
+
     async def supersede(
         self,
         by: acnt.Account,
         new_owner: str,
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         supersede transfers the ownership of the contract to another account
 
@@ -793,21 +1128,16 @@ class VStableSwapCtrt(Ctrt):
             fee (int, optional): Execution fee of this tx. Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str,any]: The response returned by the Node API
+            Dict[str, Any]: The response returned by the Node API
         """
 
-        data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
-                func_id=self.FuncIdx.SUPERSEDE,
-                data_stack=de.DataStack(de.Addr(md.Addr(new_owner))),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
-            )
+        return await self._exec(
+            by,
+            self.FuncIdx.SUPERSEDE,
+            de.DataStack(de.Addr(md.Addr(new_owner))),
+            attachment,
+            fee,
         )
-        logger.debug(data)
-        return data
 
     async def set_order(
         self,
@@ -824,7 +1154,7 @@ class VStableSwapCtrt(Ctrt):
         target_deposit: Union[int, float],
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         set_order creates the order.
 
@@ -844,38 +1174,126 @@ class VStableSwapCtrt(Ctrt):
             fee (int, optional): Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str, any]: The response returned by the Node API.
+            Dict[str, Any]: The response returned by the Node API.
+        """
+        params = self.SetOrderParams(
+            fee_base,
+            fee_target,
+            min_base,
+            max_base,
+            min_target,
+            max_target,
+            price_base,
+            price_target,
+            base_deposit,
+            target_deposit,
+        )
+        units = await self._set_order_units()
+
+        return await self._exec(
+            by,
+            self.FuncIdx.SET_ORDER,
+            self._set_order_data_stack(units, params),
+            attachment,
+            fee,
+        )
+
+    async def set_orders(
+        self,
+        by: acnt.Account,
+        orders: List[VStableSwapCtrt.SetOrderParams],
+        attachment: str = "",
+        fee: int = md.ExecCtrtFee.DEFAULT,
+        return_exceptions: bool = False,
+    ) -> List[Union[Dict[str, Any], BaseException]]:
         """
-        base_unit = await self.base_tok_unit
-        target_unit = await self.target_tok_unit
+        set_orders creates a batch of orders concurrently.
+        The token units are queried once and shared by all the orders.
 
-        base_price_unit = await self.base_price_unit
-        target_price_unit = await self.target_price_unit
+        NOTE that the clock is read once for the batch and each order is offset by its index
+        in nanoseconds, so identical orders still get distinct tx IDs. The orders are sent
+        concurrently, so the node may process them in any order and each of them is still
+        subject to the max order per user limit of the contract.
 
-        data = await by._execute_contract(
+        Args:
+            by (acnt.Account): The action taker.
+            orders (List[VStableSwapCtrt.SetOrderParams]): The parameters of the orders.
+            attachment (str, optional): The attachment of each order. Defaults to "".
+            fee (int, optional): Execution fee of each tx. Defaults to md.ExecCtrtFee.DEFAULT.
+            return_exceptions (bool, optional): Whether to return the exception of a failed order in its place
+                instead of raising it, so that the responses of the other orders are kept. Defaults to False.
+
+        Returns:
+            List[Union[Dict[str, Any], BaseException]]: The responses returned by the Node API in the order of orders.
+                Exceptions are only included when return_exceptions is True.
+        """
+        units = await self._set_order_units()
+
+        ts = md.VSYSTimestamp.now().data
+        att = _attachment(attachment)
+        reqs = [
             tx.ExecCtrtFuncTxReq(
                 ctrt_id=self._ctrt_id,
                 func_id=self.FuncIdx.SET_ORDER,
-                data_stack=de.DataStack(
-                    de.Amount.for_tok_amount(fee_base, base_unit),
-                    de.Amount.for_tok_amount(fee_target, target_unit),
-                    de.Amount.for_tok_amount(min_base, base_unit),
-                    de.Amount.for_tok_amount(max_base, base_unit),
-                    de.Amount.for_tok_amount(min_target, target_unit),
-                    de.Amount.for_tok_amount(max_target, target_unit),
-                    de.Amount.for_tok_amount(price_base, base_price_unit),
-                    de.Amount.for_tok_amount(price_target, target_price_unit),
-                    de.Amount.for_tok_amount(base_deposit, base_unit),
-                    de.Amount.for_tok_amount(target_deposit, target_unit),
-                ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
+                data_stack=self._set_order_data_stack(units, order),
+                timestamp=md.VSYSTimestamp(ts + i),
+                attachment=att,
+                fee=_exec_ctrt_fee(fee),
             )
-        )
-        logger.debug(data)
+            for i, order in enumerate(orders)
+        ]
+        try:
+            data = await self._gather_txs(
+                [by._submit_contract(req) for req in reqs], return_exceptions
+            )
+        finally:
+            # Some of the orders may have landed even if others failed.
+            self.invalidate_cache()
+        _debug("{}", lambda: data)
         return data
 
+    async def _set_order_units(self) -> List[int]:
+        """
+        _set_order_units gets the units the amounts of an order are scaled by.
+
+        Returns:
+            List[int]: The base token unit, the target token unit, the base price unit & the target price unit.
+        """
+        return await asyncio.gather(
+            self.base_tok_unit,
+            self.target_tok_unit,
+            self.base_price_unit,
+            self.target_price_unit,
+        )
+
+    @staticmethod
+    def _set_order_data_stack(
+        units: List[int], params: VStableSwapCtrt.SetOrderParams
+    ) -> de.DataStack:
+        """
+        _set_order_data_stack builds the data stack of the set order function.
+
+        Args:
+            units (List[int]): The units returned by _set_order_units.
+            params (VStableSwapCtrt.SetOrderParams): The parameters of the order.
+
+        Returns:
+            de.DataStack: The data stack.
+        """
+        base_unit, target_unit, base_price_unit, target_price_unit = units
+        return de.DataStack(
+            de.Amount.for_tok_amount(params.fee_base, base_unit),
+            de.Amount.for_tok_amount(params.fee_target, target_unit),
+            de.Amount.for_tok_amount(params.min_base, base_unit),
+            de.Amount.for_tok_amount(params.max_base, base_unit),
+            de.Amount.for_tok_amount(params.min_target, target_unit),
+            de.Amount.for_tok_amount(params.max_target, target_unit),
+            de.Amount.for_tok_amount(params.price_base, base_price_unit),
+            de.Amount.for_tok_amount(params.price_target, target_price_unit),
+            de.Amount.for_tok_amount(params.base_deposit, base_unit),
+            de.Amount.for_tok_amount(params.target_deposit, target_unit),
+        )
+
     async def update_order(
         self,
         by: acnt.Account,
@@ -890,7 +1308,7 @@ class VStableSwapCtrt(Ctrt):
         price_target: Union[int, float],
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         update_order updates the order settings.
 
@@ -909,36 +1327,37 @@ class VStableSwapCtrt(Ctrt):
             fee (int, optional): Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str, any]: The response returned by the Node API.
-        """
-        base_unit = await self.base_tok_unit
-        target_unit = await self.target_tok_unit
-
-        base_price_unit = await self.base_price_unit
-        target_price_unit = await self.target_price_unit
+            Dict[str, Any]: The response returned by the Node API.
+        """
+        (
+            base_unit,
+            target_unit,
+            base_price_unit,
+            target_price_unit,
+        ) = await asyncio.gather(
+            self.base_tok_unit,
+            self.target_tok_unit,
+            self.base_price_unit,
+            self.target_price_unit,
+        )
 
-        data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
-                func_id=self.FuncIdx.UPDATE_ORDER,
-                data_stack=de.DataStack(
-                    de.Bytes.from_base58_str(order_id),
-                    de.Amount.for_tok_amount(fee_base, base_unit),
-                    de.Amount.for_tok_amount(fee_target, target_unit),
-                    de.Amount.for_tok_amount(min_base, base_unit),
-                    de.Amount.for_tok_amount(max_base, base_unit),
-                    de.Amount.for_tok_amount(min_target, target_unit),
-                    de.Amount.for_tok_amount(max_target, target_unit),
-                    de.Amount.for_tok_amount(price_base, base_price_unit),
-                    de.Amount.for_tok_amount(price_target, target_price_unit),
-                ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
-            )
+        return await self._exec(
+            by,
+            self.FuncIdx.UPDATE_ORDER,
+            de.DataStack(
+                de.Bytes.from_base58_str(order_id),
+                de.Amount.for_tok_amount(fee_base, base_unit),
+                de.Amount.for_tok_amount(fee_target, target_unit),
+                de.Amount.for_tok_amount(min_base, base_unit),
+                de.Amount.for_tok_amount(max_base, base_unit),
+                de.Amount.for_tok_amount(min_target, target_unit),
+                de.Amount.for_tok_amount(max_target, target_unit),
+                de.Amount.for_tok_amount(price_base, base_price_unit),
+                de.Amount.for_tok_amount(price_target, target_price_unit),
+            ),
+            attachment,
+            fee,
         )
-        logger.debug(data)
-        return data
 
     async def order_deposit(
         self,
@@ -948,7 +1367,7 @@ class VStableSwapCtrt(Ctrt):
         target_deposit: Union[int, float],
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         order_deposit locks the tokens.
 
@@ -961,27 +1380,24 @@ class VStableSwapCtrt(Ctrt):
             fee (int, optional): Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str, any]: The response returned by the Node API.
+            Dict[str, Any]: The response returned by the Node API.
         """
-        base_unit = await self.base_tok_unit
-        target_unit = await self.target_tok_unit
+        base_unit, target_unit = await asyncio.gather(
+            self.base_tok_unit,
+            self.target_tok_unit,
+        )
 
-        data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
-                func_id=self.FuncIdx.ORDER_DEPOSIT,
-                data_stack=de.DataStack(
-                    de.Bytes.from_base58_str(order_id),
-                    de.Amount.for_tok_amount(base_deposit, base_unit),
-                    de.Amount.for_tok_amount(target_deposit, target_unit),
-                ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
-            )
+        return await self._exec(
+            by,
+            self.FuncIdx.ORDER_DEPOSIT,
+            de.DataStack(
+                de.Bytes.from_base58_str(order_id),
+                de.Amount.for_tok_amount(base_deposit, base_unit),
+                de.Amount.for_tok_amount(target_deposit, target_unit),
+            ),
+            attachment,
+            fee,
         )
-        logger.debug(data)
-        return data
 
     async def order_withdraw(
         self,
@@ -991,7 +1407,7 @@ class VStableSwapCtrt(Ctrt):
         target_withdraw: Union[int, float],
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         order_withdraw unlocks the tokens.
 
@@ -1004,27 +1420,24 @@ class VStableSwapCtrt(Ctrt):
             fee (int, optional): Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str, any]: The response returned by the Node API.
+            Dict[str, Any]: The response returned by the Node API.
         """
-        base_unit = await self.base_tok_unit
-        target_unit = await self.target_tok_unit
+        base_unit, target_unit = await asyncio.gather(
+            self.base_tok_unit,
+            self.target_tok_unit,
+        )
 
-        data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
-                func_id=self.FuncIdx.ORDER_WITHDRAW,
-                data_stack=de.DataStack(
-                    de.Bytes.from_base58_str(order_id),
-                    de.Amount.for_tok_amount(base_withdraw, base_unit),
-                    de.Amount.for_tok_amount(target_withdraw, target_unit),
-                ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
-            )
+        return await self._exec(
+            by,
+            self.FuncIdx.ORDER_WITHDRAW,
+            de.DataStack(
+                de.Bytes.from_base58_str(order_id),
+                de.Amount.for_tok_amount(base_withdraw, base_unit),
+                de.Amount.for_tok_amount(target_withdraw, target_unit),
+            ),
+            attachment,
+            fee,
         )
-        logger.debug(data)
-        return data
 
     async def close_order(
         self,
@@ -1032,7 +1445,7 @@ class VStableSwapCtrt(Ctrt):
         order_id: str,
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         close_order closes the order.
 
@@ -1043,23 +1456,18 @@ class VStableSwapCtrt(Ctrt):
             fee (int, optional): Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str, any]: The response returned by the Node API.
+            Dict[str, Any]: The response returned by the Node API.
         """
 
-        data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
-                func_id=self.FuncIdx.CLOSE_ORDER,
-                data_stack=de.DataStack(
-                    de.Bytes.from_base58_str(order_id),
-                ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
-            )
+        return await self._exec(
+            by,
+            self.FuncIdx.CLOSE_ORDER,
+            de.DataStack(
+                de.Bytes.from_base58_str(order_id),
+            ),
+            attachment,
+            fee,
         )
-        logger.debug(data)
-        return data
 
     async def swap_base_to_target(
         self,
@@ -1071,7 +1479,7 @@ class VStableSwapCtrt(Ctrt):
         deadline: int,
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         swap_base_to_target swaps base token to target token.
 
@@ -1086,29 +1494,26 @@ class VStableSwapCtrt(Ctrt):
             fee (int, optional): Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str, any]: The response returned by the Node API.
+            Dict[str, Any]: The response returned by the Node API.
         """
-        base_unit = await self.base_tok_unit
-        base_price_unit = await self.base_price_unit
+        base_unit, base_price_unit = await asyncio.gather(
+            self.base_tok_unit,
+            self.base_price_unit,
+        )
 
-        data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
-                func_id=self.FuncIdx.SWAP_BASE_TO_TARGET,
-                data_stack=de.DataStack(
-                    de.Bytes.from_base58_str(order_id),
-                    de.Amount.for_tok_amount(amount, base_unit),
-                    de.Amount.for_tok_amount(swap_fee, base_unit),
-                    de.Amount.for_tok_amount(price, base_price_unit),
-                    de.Timestamp(md.VSYSTimestamp.from_unix_ts(deadline)),
-                ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
-            )
+        return await self._exec(
+            by,
+            self.FuncIdx.SWAP_BASE_TO_TARGET,
+            de.DataStack(
+                de.Bytes.from_base58_str(order_id),
+                de.Amount.for_tok_amount(amount, base_unit),
+                de.Amount.for_tok_amount(swap_fee, base_unit),
+                de.Amount.for_tok_amount(price, base_price_unit),
+                de.Timestamp(md.VSYSTimestamp.from_unix_ts(deadline)),
+            ),
+            attachment,
+            fee,
         )
-        logger.debug(data)
-        return data
 
     async def swap_target_to_base(
         self,
@@ -1120,7 +1525,7 @@ class VStableSwapCtrt(Ctrt):
         deadline: int,
         attachment: str = "",
         fee: int = md.ExecCtrtFee.DEFAULT,
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """
         swap_target_to_base swaps target token to base token.
 
@@ -1135,26 +1540,23 @@ class VStableSwapCtrt(Ctrt):
             fee (int, optional): Defaults to md.ExecCtrtFee.DEFAULT.
 
         Returns:
-            Dict[str, any]: The response returned by the Node API.
+            Dict[str, Any]: The response returned by the Node API.
         """
-        target_unit = await self.target_tok_unit
-        target_price_unit = await self.target_price_unit
+        target_unit, target_price_unit = await asyncio.gather(
+            self.target_tok_unit,
+            self.target_price_unit,
+        )
 
-        data = await by._execute_contract(
-            tx.ExecCtrtFuncTxReq(
-                ctrt_id=self._ctrt_id,
-                func_id=self.FuncIdx.SWAP_TARGET_TO_BASE,
-                data_stack=de.DataStack(
-                    de.Bytes.from_base58_str(order_id),
-                    de.Amount.for_tok_amount(amount, target_unit),
-                    de.Amount.for_tok_amount(swap_fee, target_unit),
-                    de.Amount.for_tok_amount(price, target_price_unit),
-                    de.Timestamp(md.VSYSTimestamp.from_unix_ts(deadline)),
-                ),
-                timestamp=md.VSYSTimestamp.now(),
-                attachment=md.Str(attachment),
-                fee=md.ExecCtrtFee(fee),
-            )
+        return await self._exec(
+            by,
+            self.FuncIdx.SWAP_TARGET_TO_BASE,
+            de.DataStack(
+                de.Bytes.from_base58_str(order_id),
+                de.Amount.for_tok_amount(amount, target_unit),
+                de.Amount.for_tok_amount(swap_fee, target_unit),
+                de.Amount.for_tok_amount(price, target_price_unit),
+                de.Timestamp(md.VSYSTimestamp.from_unix_ts(deadline)),
+            ),
+            attachment,
+            fee,
         )
-        logger.debug(data)
-        return data
@@ -2,20 +2,40 @@
 data_entry contains DataEntry-related resources.
 """
 from __future__ import annotations
-import abc
 import struct
 from typing import Tuple, List, Union, Type
 
 from py_vsys import model as md
 
+# The precompiled formats of the fixed-size fields.
+_U64 = struct.Struct(">Q")
+_U32 = struct.Struct(">I")
+_U16 = struct.Struct(">H")
+_BOOL = struct.Struct(">?")
+# The formats of the serialized fixed-size data entries & the text header, index byte included,
+# so that one pack call builds the whole result.
+_IDX_U64 = struct.Struct(">BQ")
+_IDX_U32 = struct.Struct(">BI")
+_IDX_BOOL = struct.Struct(">B?")
+_IDX_U16 = struct.Struct(">BH")
 
-class DataEntry(abc.ABC):
+
+class DataEntry:
     """
     DataEntry is the container for data used in interacting with smart contracts.
+    Data entries are built for every contract call, so they use __slots__ instead of a __dict__.
     """
 
+    __slots__ = ("data",)
+
     IDX = 0
     SIZE = 0
+    # The index in bytes. It is derived from IDX for each subclass.
+    IDX_BYTES = b"\x00"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.IDX_BYTES = bytes((cls.IDX,))
 
     @property
     def idx_bytes(self) -> bytes:
@@ -25,10 +45,9 @@ class DataEntry(abc.ABC):
         Returns:
             bytes: The index in bytes
         """
-        return struct.pack(">B", self.IDX)
+        return self.IDX_BYTES
 
     @classmethod
-    @abc.abstractmethod
     def from_bytes(cls, b: bytes) -> DataEntry:
         """
         from_bytes parses the given bytes and constructs a DataEntry instance
@@ -40,9 +59,9 @@ class DataEntry(abc.ABC):
         Returns:
             DataEntry: The DataEntry instance
         """
+        raise NotImplementedError
 
     @classmethod
-    @abc.abstractmethod
     def deserialize(cls, b: bytes) -> DataEntry:
         """
         deserialize parses the given bytes and constructs a DataEntry instance
@@ -55,9 +74,26 @@ class DataEntry(abc.ABC):
         Returns:
             DataEntry: The DataEntry instance
         """
+        return cls.deserialize_from(b)[0]
+
+    @classmethod
+    def deserialize_from(cls, b: bytes, offset: int = 0) -> Tuple[DataEntry, int]:
+        """
+        deserialize_from parses the serialized data entry that starts at the given offset of the bytes
+        and constructs a DataEntry instance. The bytes are not copied except for the data itself.
+
+        Args:
+            b (bytes): The bytes to parse
+            offset (int, optional): The offset where the data entry starts. Defaults to 0.
+
+        Returns:
+            Tuple[DataEntry, int]: The DataEntry instance & the offset right after it
+        """
+        start = offset + 1
+        end = start + cls.SIZE
+        return cls.from_bytes(b[start:end]), end
 
     @property
-    @abc.abstractmethod
     def bytes(self) -> bytes:
         """
         bytes returns the bytes representation of the DataEntry
@@ -66,8 +102,8 @@ class DataEntry(abc.ABC):
         Returns:
             bytes: The bytes representation of the DataEntry
         """
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def serialize(self) -> bytes:
         """
         serialize serializes the containing data to bytes
@@ -75,6 +111,7 @@ class DataEntry(abc.ABC):
         Returns:
             bytes: The serialization result
         """
+        raise NotImplementedError
 
 
 class FixedSizeB58Str(DataEntry):
@@ -82,6 +119,8 @@ class FixedSizeB58Str(DataEntry):
     FixedSizeB58Str is the data entry base class for a fixed size base58 string.
     """
 
+    __slots__ = ()
+
     MODEL = md.FixedSizeB58Str
 
     def __init__(self, data: md.FixedSizeB58Str = md.FixedSizeB58Str()) -> None:
@@ -95,16 +134,12 @@ class FixedSizeB58Str(DataEntry):
     def from_bytes(cls, b: bytes) -> FixedSizeB58Str:
         return cls(cls.MODEL.from_bytes(b))
 
-    @classmethod
-    def deserialize(cls, b: bytes) -> FixedSizeB58Str:
-        return cls.from_bytes(b[1 : 1 + cls.SIZE])
-
     @property
     def bytes(self) -> bytes:
         return self.data.bytes
 
     def serialize(self) -> bytes:
-        return self.idx_bytes + self.bytes
+        return self.IDX_BYTES + self.bytes
 
 
 class PubKey(FixedSizeB58Str):
@@ -112,6 +147,8 @@ class PubKey(FixedSizeB58Str):
     PubKey is the data entry for a public key.
     """
 
+    __slots__ = ()
+
     MODEL = md.PubKey
 
     IDX = 1
@@ -130,6 +167,8 @@ class Addr(FixedSizeB58Str):
     Addr is the data entry for an address.
     """
 
+    __slots__ = ()
+
     MODEL = md.Addr
 
     IDX = 2
@@ -148,6 +187,8 @@ class Int(DataEntry):
     Int is the data entry base class for an integer.
     """
 
+    __slots__ = ()
+
     def __init__(self, data: md.Int = md.Int()) -> None:
         """
         Args:
@@ -161,23 +202,21 @@ class Long(Int):
     Long is the data entry base class for a 8-bytes integer.
     """
 
+    __slots__ = ()
+
     SIZE = 8
 
     @classmethod
     def from_bytes(cls, b: bytes) -> Long:
-        i = struct.unpack(">Q", b)[0]
+        i = _U64.unpack(b)[0]
         return cls(md.Int(i))
 
-    @classmethod
-    def deserialize(cls, b: bytes) -> Long:
-        return cls.from_bytes(b[1 : 1 + cls.SIZE])
-
     @property
     def bytes(self) -> bytes:
-        return struct.pack(">Q", self.data.data)
+        return _U64.pack(self.data.data)
 
     def serialize(self) -> bytes:
-        return self.idx_bytes + self.bytes
+        return _IDX_U64.pack(self.IDX, self.data.data)
 
 
 class Amount(Long):
@@ -185,11 +224,26 @@ class Amount(Long):
     Amount is the data entry for amount.
     """
 
+    __slots__ = ()
+
     IDX = 3
 
     def __init__(self, data: md.Int) -> None:
         self.data = data
 
+    @classmethod
+    def of(cls, raw: int) -> Amount:
+        """
+        of is the handy method to get an Amount for the given raw integer.
+
+        Args:
+            raw (int): The raw integer.
+
+        Returns:
+            Amount: The Amount instance.
+        """
+        return cls(md.Int(raw))
+
     @classmethod
     def for_vsys_amount(cls, amount: Union[int, float]) -> Amount:
         """
@@ -225,24 +279,22 @@ class Int32(Int):
     Int32 is the data entry for a 4-bytes integer.
     """
 
+    __slots__ = ()
+
     IDX = 4
     SIZE = 4
 
     @classmethod
     def from_bytes(cls, b: bytes) -> Int32:
-        i = struct.unpack(">I", b)[0]
+        i = _U32.unpack(b)[0]
         return cls(md.Int(i))
 
-    @classmethod
-    def deserialize(cls, b: bytes) -> Int32:
-        return cls.from_bytes(b[1 : 1 + cls.SIZE])
-
     @property
     def bytes(self) -> bytes:
-        return struct.pack(">I", self.data.data)
+        return _U32.pack(self.data.data)
 
     def serialize(self) -> bytes:
-        return self.idx_bytes + self.bytes
+        return _IDX_U32.pack(self.IDX, self.data.data)
 
 
 class Text(DataEntry):
@@ -250,10 +302,13 @@ class Text(DataEntry):
     Text is the data entry base class for texts(e.g. string, bytes)
     """
 
+    __slots__ = ()
+
     @classmethod
-    def deserialize(cls, b: bytes) -> Str:
-        l = struct.unpack(">H", b[1:3])[0]
-        return cls.from_bytes(b[3 : 3 + l])
+    def deserialize_from(cls, b: bytes, offset: int = 0) -> Tuple[Text, int]:
+        start = offset + 3
+        end = start + _U16.unpack_from(b, offset + 1)[0]
+        return cls.from_bytes(b[start:end]), end
 
     @property
     def len_bytes(self) -> bytes:
@@ -263,10 +318,11 @@ class Text(DataEntry):
         Returns:
             bytes: The length in bytes
         """
-        return struct.pack(">H", len(self.bytes))
+        return _U16.pack(len(self.bytes))
 
     def serialize(self) -> bytes:
-        return self.idx_bytes + self.len_bytes + self.bytes
+        b = self.bytes
+        return _IDX_U16.pack(self.IDX, len(b)) + b
 
 
 class Str(Text):
@@ -274,6 +330,8 @@ class Str(Text):
     Str is the data entry for a string.
     """
 
+    __slots__ = ()
+
     IDX = 5
 
     def __init__(self, data: md.Str = md.Str()):
@@ -301,6 +359,8 @@ class CtrtAcnt(FixedSizeB58Str):
     CtrtAcnt is the data entry for contract account.
     """
 
+    __slots__ = ()
+
     MODEL = md.CtrtID
 
     IDX = 6
@@ -319,6 +379,8 @@ class Acnt(FixedSizeB58Str):
     Acnt is the data entry for account.
     """
 
+    __slots__ = ()
+
     MODEL = md.Addr
 
     IDX = 7
@@ -337,6 +399,8 @@ class TokenID(FixedSizeB58Str):
     TokenID is the data entry for token ID.
     """
 
+    __slots__ = ()
+
     MODEL = md.TokenID
 
     IDX = 8
@@ -355,6 +419,8 @@ class Timestamp(Long):
     Timestamp is the data entry for timestamp.
     """
 
+    __slots__ = ()
+
     IDX = 9
 
     def __init__(self, data: md.VSYSTimestamp) -> None:
@@ -381,6 +447,8 @@ class Bool(DataEntry):
     Bool is the data entry for a boolean value.
     """
 
+    __slots__ = ()
+
     IDX = 10
     SIZE = 1
 
@@ -393,19 +461,14 @@ class Bool(DataEntry):
 
     @classmethod
     def from_bytes(cls, b: bytes) -> Bool:
-        v = struct.unpack(">?", b)[0]
-        return cls(md.Bool(v))
-
-    @classmethod
-    def deserialize(cls, b: bytes) -> Bool:
-        return cls.from_bytes(b[1 : 1 + cls.SIZE])
+        return cls(md.Bool(b[0] != 0))
 
     @property
     def bytes(self) -> bytes:
-        return struct.pack(">?", self.data.data)
+        return _BOOL.pack(self.data.data)
 
     def serialize(self) -> bytes:
-        return self.idx_bytes + self.bytes
+        return _IDX_BOOL.pack(self.IDX, self.data.data)
 
 
 class Bytes(Text):
@@ -413,6 +476,8 @@ class Bytes(Text):
     Bytes is the data entry for bytes
     """
 
+    __slots__ = ()
+
     IDX = 11
 
     def __init__(self, data: md.Bytes = md.Bytes()) -> None:
@@ -462,6 +527,8 @@ class Balance(Long):
     Balance is the data entry for balance.
     """
 
+    __slots__ = ()
+
     IDX = 12
 
 
@@ -470,20 +537,23 @@ class IndexMap:
     IndexMap is the map between the data entry index & corresponding data entry class.
     """
 
-    MAP = {
-        1: PubKey,
-        2: Addr,
-        3: Amount,
-        4: Int32,
-        5: Str,
-        6: CtrtAcnt,
-        7: Acnt,
-        8: TokenID,
-        9: Timestamp,
-        10: Bool,
-        11: Bytes,
-        12: Balance,
-    }
+    # The data entry classes indexed by the data entry index. Index 0 is unused.
+    _TABLE = (
+        None,
+        PubKey,
+        Addr,
+        Amount,
+        Int32,
+        Str,
+        CtrtAcnt,
+        Acnt,
+        TokenID,
+        Timestamp,
+        Bool,
+        Bytes,
+        Balance,
+    )
+    MAP = {idx: de_cls for idx, de_cls in enumerate(_TABLE) if de_cls is not None}
 
     @classmethod
     def get_de_cls(cls, idx: int) -> Type[DataEntry]:
@@ -493,10 +563,21 @@ class IndexMap:
         Args:
             idx (int): The data entry index.
 
+        Raises:
+            ValueError: If the index is invalid.
+
         Returns:
             DataEntry: The DataEntry class
         """
-        return cls.MAP[idx]
+        if 0 < idx < len(cls._TABLE):
+            return cls._TABLE[idx]
+        raise ValueError(f"Invalid data entry index {idx}")
+
+
+# The bound deserialize_from method of each data entry class indexed by the data entry index.
+_DESERIALIZERS = tuple(
+    None if de_cls is None else de_cls.deserialize_from for de_cls in IndexMap._TABLE
+)
 
 
 class DataStack:
@@ -504,6 +585,8 @@ class DataStack:
     DataStack is the collection of DataEntry(s)
     """
 
+    __slots__ = ("entries",)
+
     def __init__(self, *data_entries: Tuple[DataEntry]) -> None:
         """
         Args:
@@ -519,20 +602,29 @@ class DataStack:
         Args:
             b (bytes): The bytes to deserialize.
 
+        Raises:
+            ValueError: If a data entry index in the bytes is invalid.
+
         Returns:
             DataStack: The DataStack object created by deserialization.
         """
 
-        entries_cnt = struct.unpack(">H", b[:2])[0]
-        b = b[2:]
+        entries_cnt = _U16.unpack_from(b)[0]
+        pos = 2
 
         entries = []
         for _ in range(entries_cnt):
-            idx = struct.unpack(">B", b[:1])[0]
-            de_cls = IndexMap.get_de_cls(idx)
-            de = de_cls.deserialize(b)
+            try:
+                de, pos = _DESERIALIZERS[b[pos]](b, pos)
+            except (IndexError, TypeError):
+                # Only a bad index is reported here. Errors raised while parsing a valid entry
+                # propagate as they are.
+                if pos < len(b) and not 0 < b[pos] < len(_DESERIALIZERS):
+                    raise ValueError(
+                        f"Invalid data entry index {b[pos]} at offset {pos}"
+                    ) from None
+                raise
             entries.append(de)
-            b = b[len(de.serialize()) :]
 
         return cls(*entries)
 
@@ -543,9 +635,6 @@ class DataStack:
         Returns:
             bytes: The serializes result.
         """
-        b = struct.pack(">H", len(self.entries))
-
-        for de in self.entries:
-            b += de.serialize()
-
-        return b
+        parts = [_U16.pack(len(self.entries))]
+        parts.extend(de.serialize() for de in self.entries)
+        return b"".join(parts)
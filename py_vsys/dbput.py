@@ -8,6 +8,12 @@ from typing import Type
 
 from py_vsys import model as md
 
+# The precompiled formats of the length & id fields.
+_U16 = struct.Struct(">H")
+_U8 = struct.Struct(">B")
+# The header of serialized DB Put data: the length of the id & the data, then the id.
+_DATA_HEADER = struct.Struct(">HB")
+
 
 class DBPutKey:
     """
@@ -48,7 +54,8 @@ class DBPutKey:
         Returns:
             bytes: The serialization result
         """
-        return struct.pack(">H", len(self.data.data)) + self.bytes
+        b = self.bytes
+        return _U16.pack(len(b)) + b
 
 
 class DBPutData(abc.ABC):
@@ -83,7 +90,7 @@ class DBPutData(abc.ABC):
         Returns:
             bytes: The id in bytes.
         """
-        return struct.pack(">B", self.ID)
+        return _U8.pack(self.ID)
 
     @property
     def bytes(self) -> bytes:
@@ -103,7 +110,8 @@ class DBPutData(abc.ABC):
         Returns:
             bytes: The serialization result
         """
-        return struct.pack(">H", len(self.data.data) + 1) + self.id_bytes + self.bytes
+        b = self.bytes
+        return _DATA_HEADER.pack(len(b) + 1, self.ID) + b
 
 
 class ByteArray(DBPutData):
@@ -1,14 +1,17 @@
 """
 log contains logger initialization operations.
 """
+import os
 import sys
 from loguru import logger
 
-
-logger.configure(
-    handlers=[
-        {"sink": sys.stdout, "serialize": True},
-    ]
-)
+# Importing the SDK leaves the application's loguru handlers untouched.
+# Structured JSON output to stdout is opt-in via the PY_VSYS_JSON_LOGS env var.
+if os.environ.get("PY_VSYS_JSON_LOGS"):
+    logger.configure(
+        handlers=[
+            {"sink": sys.stdout, "serialize": True},
+        ]
+    )
 
 logger.disable("py_vsys")
@@ -3,6 +3,7 @@ model contains data model related resources.
 """
 from __future__ import annotations
 import abc
+import functools
 import time
 from typing import Any, NamedTuple, Union, Tuple, List
 import struct
@@ -14,6 +15,99 @@ from py_vsys import words as wd
 from py_vsys.utils.crypto import hashes as hs
 from py_vsys.utils.crypto import curve_25519 as curve
 
+# The precompiled formats of the length & version fields.
+_U16 = struct.Struct(">H")
+_U32 = struct.Struct(">I")
+
+_B58_ALPHABET = base58.BITCOIN_ALPHABET.decode()
+_B58_DIGITS = {c: i for i, c in enumerate(_B58_ALPHABET)}
+# Maps the bytes of the base58 alphabet to their digit values and any other byte to 0xFF.
+_B58_TABLE = bytes(_B58_DIGITS.get(chr(i), 0xFF) for i in range(256))
+
+
+def _b58_digits_to_int(digits: bytes) -> int:
+    """
+    _b58_digits_to_int converts the given base58 digit values to the integer they encode.
+    Long inputs are split in halves so that the big integer products are balanced
+    instead of growing the result digit by digit, which is quadratic in the length.
+
+    Args:
+        digits (bytes): The digit values, most significant first.
+
+    Returns:
+        int: The integer.
+    """
+    if len(digits) > 64:
+        mid = len(digits) // 2
+        hi = _b58_digits_to_int(digits[:mid])
+        return hi * 58 ** (len(digits) - mid) + _b58_digits_to_int(digits[mid:])
+
+    n = 0
+    for d in digits:
+        n = n * 58 + d
+    return n
+
+
+def _b58decode(b58_str: str) -> bytes:
+    """
+    _b58decode decodes the given base58 string like base58.b58decode.
+    The characters are mapped to their digit values by a single bytes.translate call
+    and it stays fast for strings of thousands of characters(e.g. contract meta data).
+
+    Args:
+        b58_str (str): The base58 string.
+
+    Raises:
+        ValueError: If the string contains a character out of the base58 alphabet.
+
+    Returns:
+        bytes: The decoded bytes.
+    """
+    b = b58_str.encode().rstrip()
+    stripped = b.lstrip(b"1")
+    digits = stripped.translate(_B58_TABLE)
+    if b"\xff" in digits:
+        c = next(c for c in b58_str.rstrip() if c not in _B58_DIGITS)
+        raise ValueError(f"Invalid character {c!r} in base58 string")
+
+    n = _b58_digits_to_int(digits)
+    pad = b"\0" * (len(b) - len(stripped))
+    return pad + n.to_bytes((n.bit_length() + 7) // 8, "big")
+
+
+# Strings like order IDs are decoded again and again, so the recent results are kept.
+# The decoded bytes are immutable and safe to share.
+_b58decode_cached = functools.lru_cache(maxsize=2048)(_b58decode)
+
+
+# The base58 strings of all values below 58 ** 2, so that the encoding loop yields 2 digits per division.
+_B58_PAIRS = [a + b for a in _B58_ALPHABET for b in _B58_ALPHABET]
+
+
+def _b58encode(b: bytes) -> str:
+    """
+    _b58encode encodes the given bytes to a base58 string like base58.b58encode(b).decode().
+    The big integer is divided by 58 ** 2 per step to halve the number of divisions.
+
+    Args:
+        b (bytes): The bytes to encode.
+
+    Returns:
+        str: The base58 string.
+    """
+    n = int.from_bytes(b, "big")
+    pairs = []
+    while n >= 3364:
+        n, r = divmod(n, 3364)
+        pairs.append(_B58_PAIRS[r])
+    if n >= 58:
+        pairs.append(_B58_PAIRS[n])
+    elif n:
+        pairs.append(_B58_ALPHABET[n])
+    pairs.reverse()
+    pad = len(b) - len(b.lstrip(b"\0"))
+    return "1" * pad + "".join(pairs)
+
 
 class Model(abc.ABC):
     """
@@ -22,8 +116,14 @@ class Model(abc.ABC):
 
     NOTE that the validate() method is deliberately called within the constructor so as
     to avoid accidental malformed data as much as possible.
+    Models are built for every transaction, so they use __slots__ instead of a __dict__.
     """
 
+    __slots__ = ("data",)
+
+    # The type the containing data must be of.
+    DATA_TYPE: type = object
+
     def __init__(self, data: Any) -> None:
         """
         Args:
@@ -32,11 +132,19 @@ class Model(abc.ABC):
         self.data = data
         self.validate()
 
-    @abc.abstractmethod
     def validate(self) -> None:
         """
         validate validates the containing data.
+        It checks the type of the data against DATA_TYPE.
+        Subclasses extend it with the checks of their own.
+
+        Raises:
+            TypeError: If the data is not of DATA_TYPE.
         """
+        if not isinstance(self.data, self.DATA_TYPE):
+            raise TypeError(
+                f"Data in {self.__class__.__name__} must be of type {self.DATA_TYPE.__name__}"
+            )
 
     def __str__(self) -> str:
         """
@@ -50,12 +158,32 @@ class Model(abc.ABC):
     def __eq__(self, other: Model) -> bool:
         return self.__class__ == other.__class__ and self.data == other.data
 
+    @classmethod
+    def unchecked(cls, data: Any) -> Model:
+        """
+        unchecked creates a new instance of the model without validating the data.
+        It is meant for data the SDK has derived itself and knows to be valid.
+
+        Args:
+            data (Any): The data to contain.
+
+        Returns:
+            Model: The model instance.
+        """
+        obj = cls.__new__(cls)
+        obj.data = data
+        return obj
+
 
 class Bytes(Model):
     """
     Bytes is the data model for bytes.
     """
 
+    __slots__ = ()
+
+    DATA_TYPE = bytes
+
     def __init__(self, data: bytes = b"") -> None:
         """
         Args:
@@ -72,13 +200,21 @@ class Bytes(Model):
         Returns:
             str: The base58 string representation.
         """
-        return base58.b58encode(self.data).decode("latin-1")
+        return _b58encode(self.data)
 
-    def validate(self) -> None:
-        cls_name = self.__class__.__name__
+    @staticmethod
+    def to_b58_str(b: bytes) -> str:
+        """
+        to_b58_str returns the base58 string representation of the given bytes
+        without wrapping them in a Bytes object first.
 
-        if not isinstance(self.data, bytes):
-            raise TypeError(f"Data in {cls_name} must be bytes")
+        Args:
+            b (bytes): The bytes to encode.
+
+        Returns:
+            str: The base58 string representation.
+        """
+        return _b58encode(b)
 
     @classmethod
     def from_b58_str(cls, s: str) -> Bytes:
@@ -91,7 +227,7 @@ class Bytes(Model):
         Returns:
             Bytes: the Bytes instance.
         """
-        return cls(base58.b58decode(s))
+        return cls(_b58decode_cached(s))
 
     @classmethod
     def from_str(cls, s: str) -> Bytes:
@@ -111,16 +247,16 @@ class AcntSeedHash(Bytes):
     AcntSeedHash is the data model class for account seed hash.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 32
 
     def validate(self) -> None:
         super().validate()
 
-        cls_name = self.__class__.__name__
-
         if len(self.data) != self.BYTES_LEN:
             raise ValueError(
-                f"Data in {cls_name} must be exactly {self.BYTES_LEN} bytes."
+                f"Data in {self.__class__.__name__} must be exactly {self.BYTES_LEN} bytes."
             )
 
     @property
@@ -145,6 +281,10 @@ class Str(Model):
     Str is the data model for string.
     """
 
+    __slots__ = ()
+
+    DATA_TYPE = str
+
     def __init__(self, data: str = "") -> None:
         """
         Args:
@@ -184,31 +324,27 @@ class Str(Model):
         Returns:
             str: The base58 string representation.
         """
-        return base58.b58encode(self.data).decode("latin-1")
-
-    def validate(self) -> None:
-        cls_name = self.__class__.__name__
-
-        if not isinstance(self.data, str):
-            raise TypeError(f"Data in {cls_name} must be a str")
+        return _b58encode(self.data.encode("latin-1"))
 
 
 class Seed(Str):
+    __slots__ = ()
+
     WORD_CNT = 15
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         words = self.data.split(" ")
         if len(words) != self.WORD_CNT:
             raise ValueError(
-                f"Data in {cls_name} must consist exactly {self.WORD_CNT} words"
+                f"Data in {self.__class__.__name__} must consist exactly {self.WORD_CNT} words"
             )
 
         for w in words:
             if not w in wd.WORDS_SET:
-                raise ValueError(f"Data in {cls_name} contains invalid words")
+                raise ValueError(
+                    f"Data in {self.__class__.__name__} contains invalid words"
+                )
 
     def get_acnt_seed_hash(self, nonce: Nonce) -> B58Str:
         """
@@ -231,8 +367,11 @@ class Seed(Str):
 class B58Str(Str):
     """
     B58Str is the data model for base58 string.
+    The decoded bytes are kept once computed, as validation & most properties need them.
     """
 
+    __slots__ = ("_bytes",)
+
     @classmethod
     def from_bytes(cls, b: bytes) -> B58Str:
         """
@@ -244,7 +383,11 @@ class B58Str(Str):
         Returns:
             B58Str: The B58Str instance.
         """
-        return cls(base58.b58encode(b).decode("latin-1"))
+        obj = cls.__new__(cls)
+        obj.data = _b58encode(b)
+        obj._bytes = bytes(b)
+        obj.validate()
+        return obj
 
     @property
     def bytes(self) -> bytes:
@@ -254,16 +397,20 @@ class B58Str(Str):
         Returns:
             bytes: The bytes representation.
         """
-        return base58.b58decode(self.data)
+        try:
+            return self._bytes
+        except AttributeError:
+            b = self._bytes = _b58decode(self.data)
+            return b
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         try:
             self.bytes
         except ValueError:
-            raise ValueError(f"Data in {cls_name} must be base58-decodable")
+            raise ValueError(
+                f"Data in {self.__class__.__name__} must be base58-decodable"
+            )
 
 
 class FixedSizeB58Str(B58Str):
@@ -271,15 +418,15 @@ class FixedSizeB58Str(B58Str):
     FixedSizeB58Str is the data model for fixed-size base58 string.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 0
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         if not len(self.bytes) == self.BYTES_LEN:
             raise ValueError(
-                f"Data in {cls_name} must be exactly {self.BYTES_LEN} bytes after base58 decode"
+                f"Data in {self.__class__.__name__} must be exactly {self.BYTES_LEN} bytes after base58 decode"
             )
 
 
@@ -288,6 +435,8 @@ class Addr(FixedSizeB58Str):
     Addr is the data model for an address.
     """
 
+    __slots__ = ()
+
     VER = 5
     VER_BYTES_LEN = 1
     CHAIN_ID_BYTES_LEN = 1
@@ -296,6 +445,7 @@ class Addr(FixedSizeB58Str):
     BYTES_LEN = (
         VER_BYTES_LEN + CHAIN_ID_BYTES_LEN + PUB_KEY_HASH_BYTES_LEN + CHECKSUM_BYTES_LEN
     )
+    CHAIN_IDS = frozenset(c.value for c in ch.ChainID)
 
     @property
     def version(self) -> int:
@@ -383,21 +533,18 @@ class Addr(FixedSizeB58Str):
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         if self.version != self.VER:
-            raise ValueError(f"Data in {cls_name} has invalid address version")
-
-        chain_id_valid = any([self.chain_id == c.value for c in ch.ChainID])
-        if not chain_id_valid:
-            raise ValueError(f"Data in {cls_name} has invalid chain_id")
+            raise ValueError(
+                f"Data in {self.__class__.__name__} has invalid address version"
+            )
 
-        def ke_bla_hash(b: bytes) -> bytes:
-            return hs.keccak256_hash(hs.blake2b_hash(b))
+        if self.chain_id not in self.CHAIN_IDS:
+            raise ValueError(f"Data in {self.__class__.__name__} has invalid chain_id")
 
+        b = self.bytes
         cl = self.CHECKSUM_BYTES_LEN
-        if self.checksum != ke_bla_hash(self.bytes[:-cl])[:cl]:
-            raise ValueError(f"Data in {cls_name} has invalid checksum")
+        if b[-cl:] != hs.keccak256_hash(hs.blake2b_hash(b[:-cl]))[:cl]:
+            raise ValueError(f"Data in {self.__class__.__name__} has invalid checksum")
 
     @classmethod
     def from_bytes_md(cls, b: Bytes) -> Addr:
@@ -437,8 +584,23 @@ class CtrtMetaBytes:
         Returns:
             CtrtMetaBytes: The CtrtMetaBytes object created by deserialization.
         """
-        l = struct.unpack(">H", b[:2])[0]
-        return cls(b[2 : 2 + l])
+        return cls.deserialize_from(b)[0]
+
+    @classmethod
+    def deserialize_from(cls, b: bytes, offset: int = 0) -> Tuple[CtrtMetaBytes, int]:
+        """
+        deserialize_from deserializes the CtrtMetaBytes that starts at the given offset of the bytes.
+
+        Args:
+            b (bytes): The bytes to deserialize.
+            offset (int, optional): The offset where the CtrtMetaBytes starts. Defaults to 0.
+
+        Returns:
+            Tuple[CtrtMetaBytes, int]: The CtrtMetaBytes object & the offset right after it.
+        """
+        start = offset + 2
+        end = start + _U16.unpack_from(b, offset)[0]
+        return cls(b[start:end]), end
 
     @property
     def len_bytes(self) -> bytes:
@@ -448,7 +610,7 @@ class CtrtMetaBytes:
         Returns:
             bytes: The length in bytes.
         """
-        return struct.pack(">H", len(self.data))
+        return _U16.pack(len(self.data))
 
     def serialize(self) -> bytes:
         """
@@ -486,20 +648,41 @@ class CtrtMetaBytesList:
         Returns:
             CtrtMetaBytesList: The CtrtMetaBytesList object created by deserialization.
         """
+        return cls.deserialize_from(b, 0, with_bytes_len)[0]
+
+    @classmethod
+    def deserialize_from(
+        cls, b: bytes, offset: int = 0, with_bytes_len: bool = True
+    ) -> Tuple[CtrtMetaBytesList, int]:
+        """
+        deserialize_from deserializes the CtrtMetaBytesList that starts at the given offset of the bytes.
+        The bytes are walked with an offset instead of being re-sliced for every item.
+
+        Args:
+            b (bytes): The bytes to deserialize.
+            offset (int, optional): The offset where the CtrtMetaBytesList starts. Defaults to 0.
+            with_bytes_len (bool, optional): If the first 2 bytes of the data
+                should be treated as the meta data that indicates the length for the data.
+                Defaults to True.
+
+        Returns:
+            Tuple[CtrtMetaBytesList, int]: The CtrtMetaBytesList object & the offset right after it.
+        """
+        pos = offset
         if with_bytes_len:
-            l = struct.unpack(">H", b[:2])[0]
-            b = b[2 : 2 + l]
+            end = pos + 2 + _U16.unpack_from(b, pos)[0]
+            pos += 2
 
-        items_cnt = struct.unpack(">H", b[:2])[0]
-        b = b[2:]
+        items_cnt = _U16.unpack_from(b, pos)[0]
+        pos += 2
         items = []
         for _ in range(items_cnt):
-            l = struct.unpack(">H", b[:2])[0]
-            item = CtrtMetaBytes.deserialize(b)
+            item, pos = CtrtMetaBytes.deserialize_from(b, pos)
             items.append(item)
-            b = b[2 + l :]
 
-        return cls(*items)
+        if not with_bytes_len:
+            end = pos
+        return cls(*items), end
 
     def serialize(self, with_bytes_len: bool = True) -> bytes:
         """
@@ -513,13 +696,12 @@ class CtrtMetaBytesList:
         Returns:
             bytes: The serialization result.
         """
-        b = struct.pack(">H", len(self.items))
-
-        for i in self.items:
-            b += i.serialize()
+        parts = [_U16.pack(len(self.items))]
+        parts.extend(i.serialize() for i in self.items)
+        b = b"".join(parts)
 
         if with_bytes_len:
-            b = struct.pack(">H", len(b)) + b
+            b = _U16.pack(len(b)) + b
 
         return b
 
@@ -572,7 +754,7 @@ class CtrtMeta:
         Returns:
             CtrtMeta: The result CtrtMeta object.
         """
-        b = base58.b58decode(b58_str)
+        b = _b58decode(b58_str)
         return cls.deserialize(b)
 
     @classmethod
@@ -586,45 +768,20 @@ class CtrtMeta:
         Returns:
             CtrtMeta: The result CtrtMeta object.
         """
-
-        def parse_len(b: bytes) -> int:
-            """
-            parse_len unpacks the given 2 bytes as an unsigned short integer.
-
-            Args:
-                b (bytes): The bytes to unpack.
-
-            Returns:
-                int: The unpacked value.
-            """
-            return struct.unpack(">H", b)[0]
-
         lang_code = b[:4].decode("latin-1")
-        b = b[4:]
-
-        lang_ver = struct.unpack(">I", b[:4])[0]
-        b = b[4:]
+        lang_ver = _U32.unpack_from(b, 4)[0]
+        pos = 8
 
-        l = parse_len(b[:2])
-        triggers = CtrtMetaBytesList.deserialize(b)
-        b = b[2 + l :]
-
-        l = parse_len(b[:2])
-        descriptors = CtrtMetaBytesList.deserialize(b)
-        b = b[2 + l :]
-
-        l = parse_len(b[:2])
-        state_vars = CtrtMetaBytesList.deserialize(b)
-        b = b[2 + l :]
+        triggers, pos = CtrtMetaBytesList.deserialize_from(b, pos)
+        descriptors, pos = CtrtMetaBytesList.deserialize_from(b, pos)
+        state_vars, pos = CtrtMetaBytesList.deserialize_from(b, pos)
 
         if lang_ver == 1:
             state_map = CtrtMetaBytesList()
         else:
-            l = parse_len(b[:2])
-            state_map = CtrtMetaBytesList.deserialize(b)
-            b = b[2 + l :]
+            state_map, pos = CtrtMetaBytesList.deserialize_from(b, pos)
 
-        textual = CtrtMetaBytesList.deserialize(b, with_bytes_len=False)
+        textual, _ = CtrtMetaBytesList.deserialize_from(b, pos, with_bytes_len=False)
 
         return cls(
             lang_code, lang_ver, triggers, descriptors, state_vars, state_map, textual
@@ -640,7 +797,7 @@ class CtrtMeta:
         stmap_bytes = b"" if self.lang_ver == 1 else self.state_map.serialize()
         b = (
             self.lang_code.encode("latin-1")
-            + struct.pack(">I", self.lang_ver)
+            + _U32.pack(self.lang_ver)
             + self.triggers.serialize()
             + self.descriptors.serialize()
             + self.state_vars.serialize()
@@ -655,6 +812,8 @@ class CtrtID(FixedSizeB58Str):
     CtrtID is the data model for contract ID.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 26
 
     def get_tok_id(self, tok_idx: int) -> TokenID:
@@ -674,15 +833,11 @@ class CtrtID(FixedSizeB58Str):
         ctrt_id_no_checksum = (
             struct.pack("<b", CtrtMeta.TOKEN_ADDR_VER)
             + raw_ctrt_id
-            + struct.pack(">I", tok_idx)
+            + _U32.pack(tok_idx)
         )
         h = hs.keccak256_hash(hs.blake2b_hash(ctrt_id_no_checksum))
 
-        tok_id_bytes = base58.b58encode(
-            ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN]
-        )
-
-        tok_id = tok_id_bytes.decode("latin-1")
+        tok_id = _b58encode(ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN])
         return TokenID(tok_id)
 
 
@@ -691,6 +846,8 @@ class TokenID(FixedSizeB58Str):
     TokenID is the data model for token ID.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 30
     MAINNET_VSYS_TOK_ID = "TWatCreEv7ayv6iAfLgke6ppVV33kDjFqSJn8yicf"
     TESTNET_VSYS_TOK_ID = "TWuKDNU1SAheHR99s1MbGZLPh1KophEmKk1eeU3mW"
@@ -714,7 +871,7 @@ class TokenID(FixedSizeB58Str):
         Returns:
             CtrtID: The contract ID.
         """
-        b = base58.b58decode(self.data)
+        b = _b58decode(self.data)
         raw_ctrt_id = b[
             1 : (len(b) - CtrtMeta.TOKEN_IDX_BYTES_LEN - CtrtMeta.CHECKSUM_LEN)
         ]
@@ -722,10 +879,7 @@ class TokenID(FixedSizeB58Str):
 
         h = hs.keccak256_hash(hs.blake2b_hash(ctrt_id_no_checksum))
 
-        ctrt_id_bytes = base58.b58encode(
-            ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN]
-        )
-        ctrt_id_str = ctrt_id_bytes.decode("latin1")
+        ctrt_id_str = _b58encode(ctrt_id_no_checksum + h[: CtrtMeta.CHECKSUM_LEN])
         return CtrtID(ctrt_id_str)
 
 
@@ -734,6 +888,8 @@ class TXID(FixedSizeB58Str):
     TXID is the data model for transaction ID.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 32
 
 
@@ -742,6 +898,8 @@ class PubKey(FixedSizeB58Str):
     PubKey is the data model for public key.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 32
 
 
@@ -750,6 +908,8 @@ class PriKey(FixedSizeB58Str):
     PriKey is the data model for private key.
     """
 
+    __slots__ = ()
+
     BYTES_LEN = 32
 
 
@@ -758,6 +918,10 @@ class Int(Model):
     Int is the data model for an integer.
     """
 
+    __slots__ = ()
+
+    DATA_TYPE = int
+
     def __init__(self, data: int = 0) -> None:
         """
         Args:
@@ -766,23 +930,18 @@ class Int(Model):
         self.data = data
         self.validate()
 
-    def validate(self) -> None:
-        cls_name = self.__class__.__name__
-        if not isinstance(self.data, int):
-            raise TypeError(f"Data in {cls_name} must be an int")
-
 
 class NonNegativeInt(Int):
     """
     NonNegativeInt is the data model for a non-negative integer.
     """
 
+    __slots__ = ()
+
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         if not self.data >= 0:
-            raise ValueError(f"Data in {cls_name} must be non negative")
+            raise ValueError(f"Data in {self.__class__.__name__} must be non negative")
 
 
 class TokenIdx(NonNegativeInt):
@@ -790,6 +949,8 @@ class TokenIdx(NonNegativeInt):
     TokenIdx is the data model for token index.
     """
 
+    __slots__ = ()
+
     pass
 
 
@@ -798,6 +959,8 @@ class Nonce(NonNegativeInt):
     Nonce is the data model for nonce (used with seed for an account).
     """
 
+    __slots__ = ()
+
     pass
 
 
@@ -806,6 +969,8 @@ class VSYSTimestamp(NonNegativeInt):
     VSYSTimestamp is the data model for the timestamp used in VSYS.
     """
 
+    __slots__ = ()
+
     SCALE = 1_000_000_000
 
     @classmethod
@@ -832,11 +997,14 @@ class VSYSTimestamp(NonNegativeInt):
     def now(cls) -> VSYSTimestamp:
         """
         now creates a new VSYSTimestamp for current time.
+        The current time is always a valid timestamp, so the validation is skipped.
 
         Returns:
             VSYSTimestamp: The VSYSTimestamp.
         """
-        return cls(int(time.time() * cls.SCALE))
+        # The timestamp is in nanoseconds(i.e. SCALE is 10 ** 9), so the clock is read
+        # as an exact integer instead of going through a float.
+        return cls.unchecked(time.time_ns())
 
     @property
     def unix_ts(self) -> float:
@@ -844,19 +1012,47 @@ class VSYSTimestamp(NonNegativeInt):
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         if not (self.data == 0 or self.data >= self.SCALE):
             raise ValueError(
-                f"Data in {cls_name} must be either be 0 or equal or greater than {self.SCALE}"
+                f"Data in {self.__class__.__name__} must be either be 0 or equal or greater than {self.SCALE}"
             )
 
 
+def _scale_amount(amount: Union[int, float], unit: int, cls_name: str) -> int:
+    """
+    _scale_amount scales the given amount by the unit into the integer the chain stores.
+
+    Args:
+        amount (Union[int, float]): The amount.
+        unit (int): The unit.
+        cls_name (str): The name of the model to report in the error message.
+
+    Raises:
+        ValueError: If the amount is finer than the granularity of the unit.
+
+    Returns:
+        int: The scaled amount.
+    """
+    data = amount * unit
+    if isinstance(data, int):
+        # An int amount always meets the granularity.
+        return data
+
+    int_data = int(data)
+    if int_data < data:
+        raise ValueError(
+            f"Invalid amount for {cls_name}: {amount}. The minimal valid amount granularity is {1 / unit}"
+        )
+    return int_data
+
+
 class Token(NonNegativeInt):
     """
     Token is the data model for tokens.
     """
 
+    __slots__ = ("unit",)
+
     def __init__(self, data: int = 0, unit: int = 0) -> None:
         """
         Args:
@@ -887,14 +1083,23 @@ class Token(NonNegativeInt):
         Returns:
             Token: The Token.
         """
-        data = amount * unit
+        return cls(_scale_amount(amount, unit, cls.__name__), unit)
 
-        if int(data) < data:
-            raise ValueError(
-                f"Invalid amount for {cls.__name__}: {amount}. The minimal valid amount granularity is {1 / unit}"
-            )
+    @classmethod
+    def unchecked(cls, data: int, unit: int = 0) -> Token:
+        """
+        unchecked creates a new Token without validating the data.
+
+        Args:
+            data (int): The data to contain.
+            unit (int, optional): The unit of the token. Defaults to 0.
 
-        return cls(int(data), unit)
+        Returns:
+            Token: The Token.
+        """
+        obj = super().unchecked(data)
+        obj.unit = unit
+        return obj
 
 
 class VSYS(NonNegativeInt):
@@ -902,6 +1107,8 @@ class VSYS(NonNegativeInt):
     VSYS is the data model for VSYS(the native token on VSYS blockchain).
     """
 
+    __slots__ = ()
+
     UNIT = 1_00_000_000
 
     @property
@@ -925,14 +1132,7 @@ class VSYS(NonNegativeInt):
         Returns:
             VSYS: The VSYS.
         """
-        data = amount * cls.UNIT
-
-        if int(data) < data:
-            raise ValueError(
-                f"Invalid amount for {cls.__name__}: {amount}. The minimal valid amount granularity is {1 / cls.UNIT}"
-            )
-
-        return cls(int(data))
+        return cls(_scale_amount(amount, cls.UNIT, cls.__name__))
 
     def __mul__(self, factor: Union[int, float]) -> VSYS:
         """
@@ -957,6 +1157,8 @@ class Fee(VSYS):
     Fee is the data model for transaction fee.
     """
 
+    __slots__ = ()
+
     DEFAULT = int(VSYS.UNIT * 0.1)
 
     def __init__(self, data: int = 0) -> None:
@@ -970,11 +1172,9 @@ class Fee(VSYS):
 
     def validate(self) -> None:
         super().validate()
-        cls_name = self.__class__.__name__
-
         if not self.data >= self.DEFAULT:
             raise ValueError(
-                f"Data in {cls_name} must be equal or greater than {self.DEFAULT}"
+                f"Data in {self.__class__.__name__} must be equal or greater than {self.DEFAULT}"
             )
 
 
@@ -983,6 +1183,8 @@ class PaymentFee(Fee):
     PaymentFee is the data model for the fee of a transaction where the type is Payment.
     """
 
+    __slots__ = ()
+
     pass
 
 
@@ -991,6 +1193,8 @@ class LeasingFee(Fee):
     LeasingFee is the data model for the fee of a transaction where the type is Leasing.
     """
 
+    __slots__ = ()
+
     pass
 
 
@@ -999,6 +1203,8 @@ class LeasingCancelFee(Fee):
     LeasingCancelFee is the data model for the fee of a transaction where the type is Leasing Cancel.
     """
 
+    __slots__ = ()
+
     pass
 
 
@@ -1007,6 +1213,8 @@ class RegCtrtFee(Fee):
     RegCtrtFee is the data model for the fee of a transaction where the type is Register Contract.
     """
 
+    __slots__ = ()
+
     DEFAULT = VSYS.UNIT * 100
 
 
@@ -1015,6 +1223,8 @@ class ExecCtrtFee(Fee):
     ExecCtrtFee is the data model for the fee of a transaction where the type is Execute Contract.
     """
 
+    __slots__ = ()
+
     DEFAULT = int(VSYS.UNIT * 0.3)
 
 
@@ -1023,6 +1233,8 @@ class ContendSlotsFee(Fee):
     ContendSlotsFee is the data model for the fee of a transaction where the type is Contend Slots.
     """
 
+    __slots__ = ()
+
     DEFAULT = VSYS.UNIT * 50_000
 
 
@@ -1031,6 +1243,8 @@ class DBPutFee(Fee):
     DBPutFee is the data model for the fee of a transaction where the type is DB Put.
     """
 
+    __slots__ = ()
+
     DEFAULT = VSYS.UNIT
 
 
@@ -1039,6 +1253,10 @@ class Bool(Model):
     Bool is the data model for a boolean value.
     """
 
+    __slots__ = ()
+
+    DATA_TYPE = bool
+
     def __init__(self, data: bool = False) -> None:
         """
         Args:
@@ -1047,12 +1265,6 @@ class Bool(Model):
         self.data = data
         self.validate()
 
-    def validate(self) -> None:
-        cls_name = self.__class__.__name__
-
-        if not isinstance(self.data, bool):
-            raise TypeError(f"Data in {cls_name} must be a bool")
-
 
 class KeyPair():
     """
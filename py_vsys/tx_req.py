@@ -16,6 +16,16 @@ from py_vsys import model as md
 from py_vsys import dbput as dp
 from py_vsys.utils.crypto import curve_25519 as curve
 
+# The precompiled formats of the fields to sign.
+_U8 = struct.Struct(">B")
+_U16 = struct.Struct(">H")
+# The fixed-size fields packed together with one call each: the fee, fee scale & timestamp tail
+# shared by most requests, plus the fixed parts of Payment, Lease & Lease Cancel.
+_FEE_TAIL = struct.Struct(">QHQ")
+_PAYMENT_HEAD = struct.Struct(">BQQQH")
+_LEASE_TAIL = struct.Struct(">QQHQ")
+_LEASE_CANCEL_HEAD = struct.Struct(">BQHQ")
+
 
 class TxType(enum.Enum):
     """
@@ -40,14 +50,17 @@ class TxType(enum.Enum):
         Returns:
             bytes: The serilization result
         """
-        return struct.pack(">B", self.value)
+        return _U8.pack(self.value)
 
 
 class TxReq(abc.ABC):
     """
-    TxReq is the abstract base class for Transaction Request
+    TxReq is the abstract base class for Transaction Request.
+    Requests are built for every transaction, so they use __slots__ instead of a __dict__.
     """
 
+    __slots__ = ()
+
     FEE_SCALE = 100
 
     @property
@@ -79,6 +92,7 @@ class PaymentTxReq(TxReq):
     """
 
     TX_TYPE = TxType.PAYMENT
+    __slots__ = ("recipient", "amount", "timestamp", "attachment", "fee")
 
     def __init__(
         self,
@@ -105,13 +119,15 @@ class PaymentTxReq(TxReq):
     @property
     def data_to_sign(self) -> bytes:
         return (
-            self.TX_TYPE.serialize()
-            + struct.pack(">Q", self.timestamp.data)
-            + struct.pack(">Q", self.amount.data)
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
+            _PAYMENT_HEAD.pack(
+                self.TX_TYPE.value,
+                self.timestamp.data,
+                self.amount.data,
+                self.fee.data,
+                self.FEE_SCALE,
+            )
             + self.recipient.bytes
-            + struct.pack(">H", len(self.attachment.data))
+            + _U16.pack(len(self.attachment.data))
             + self.attachment.bytes
         )
 
@@ -133,7 +149,7 @@ class PaymentTxReq(TxReq):
             "feeScale": self.FEE_SCALE,
             "timestamp": self.timestamp.data,
             "attachment": self.attachment.b58_str,
-            "signature": md.Bytes(self.sign(key_pair)).b58_str,
+            "signature": md.Bytes.to_b58_str(self.sign(key_pair)),
         }
 
 
@@ -143,6 +159,7 @@ class LeaseTxReq(TxReq):
     """
 
     TX_TYPE = TxType.LEASE
+    __slots__ = ("supernode_addr", "amount", "timestamp", "fee")
 
     def __init__(
         self,
@@ -168,10 +185,9 @@ class LeaseTxReq(TxReq):
         return (
             self.TX_TYPE.serialize()
             + self.supernode_addr.bytes
-            + struct.pack(">Q", self.amount.data)
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + struct.pack(">Q", self.timestamp.data)
+            + _LEASE_TAIL.pack(
+                self.amount.data, self.fee.data, self.FEE_SCALE, self.timestamp.data
+            )
         )
 
     def to_broadcast_leasing_payload(self, key_pair: md.KeyPair) -> Dict[str, Any]:
@@ -182,7 +198,7 @@ class LeaseTxReq(TxReq):
             "fee": self.fee.data,
             "feeScale": self.FEE_SCALE,
             "timestamp": self.timestamp.data,
-            "signature": md.Bytes(self.sign(key_pair)).b58_str,
+            "signature": md.Bytes.to_b58_str(self.sign(key_pair)),
         }
 
 
@@ -192,6 +208,7 @@ class LeaseCancelTxReq(TxReq):
     """
 
     TX_TYPE = TxType.LEASE_CANCEL
+    __slots__ = ("leasing_tx_id", "timestamp", "fee")
 
     def __init__(
         self,
@@ -212,10 +229,9 @@ class LeaseCancelTxReq(TxReq):
     @property
     def data_to_sign(self) -> bytes:
         return (
-            self.TX_TYPE.serialize()
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + struct.pack(">Q", self.timestamp.data)
+            _LEASE_CANCEL_HEAD.pack(
+                self.TX_TYPE.value, self.fee.data, self.FEE_SCALE, self.timestamp.data
+            )
             + self.leasing_tx_id.bytes
         )
 
@@ -235,7 +251,7 @@ class LeaseCancelTxReq(TxReq):
             "fee": self.fee.data,
             "feeScale": self.FEE_SCALE,
             "timestamp": self.timestamp.data,
-            "signature": md.Bytes(self.sign(key_pair)).b58_str,
+            "signature": md.Bytes.to_b58_str(self.sign(key_pair)),
         }
 
 
@@ -245,6 +261,15 @@ class RegCtrtTxReq(TxReq):
     """
 
     TX_TYPE = TxType.REGISTER_CONTRACT
+    __slots__ = (
+        "data_stack",
+        "ctrt_meta",
+        "timestamp",
+        "description",
+        "fee",
+        "_ctrt_meta_bytes",
+        "_data_stack_bytes",
+    )
 
     def __init__(
         self,
@@ -269,6 +294,36 @@ class RegCtrtTxReq(TxReq):
         self.description = description
         self.fee = fee
 
+    @property
+    def ctrt_meta_bytes(self) -> bytes:
+        """
+        ctrt_meta_bytes returns the serialized contract meta data.
+        It is needed both for signing & for the payload, so it is serialized once.
+
+        Returns:
+            bytes: The serialized contract meta data.
+        """
+        try:
+            return self._ctrt_meta_bytes
+        except AttributeError:
+            b = self._ctrt_meta_bytes = self.ctrt_meta.serialize()
+            return b
+
+    @property
+    def data_stack_bytes(self) -> bytes:
+        """
+        data_stack_bytes returns the serialized data stack.
+        It is needed both for signing & for the payload, so it is serialized once.
+
+        Returns:
+            bytes: The serialized data stack.
+        """
+        try:
+            return self._data_stack_bytes
+        except AttributeError:
+            b = self._data_stack_bytes = self.data_stack.serialize()
+            return b
+
     @property
     def data_to_sign(self) -> bytes:
         """
@@ -277,20 +332,20 @@ class RegCtrtTxReq(TxReq):
         Returns:
             bytes: The data to be signed for this request
         """
-        ctrt_meta = self.ctrt_meta.serialize()
-        data_stack = self.data_stack.serialize()
-
-        return (
-            self.TX_TYPE.serialize()
-            + struct.pack(">H", len(ctrt_meta))
-            + ctrt_meta
-            + struct.pack(">H", len(data_stack))
-            + data_stack
-            + struct.pack(">H", len(self.description.data))
-            + self.description.bytes
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + struct.pack(">Q", self.timestamp.data)
+        ctrt_meta = self.ctrt_meta_bytes
+        data_stack = self.data_stack_bytes
+
+        return b"".join(
+            [
+                self.TX_TYPE.serialize(),
+                _U16.pack(len(ctrt_meta)),
+                ctrt_meta,
+                _U16.pack(len(data_stack)),
+                data_stack,
+                _U16.pack(len(self.description.data)),
+                self.description.bytes,
+                _FEE_TAIL.pack(self.fee.data, self.FEE_SCALE, self.timestamp.data),
+            ]
         )
 
     def to_broadcast_register_payload(self, key_pair: md.KeyPair) -> Dict[str, Any]:
@@ -306,13 +361,13 @@ class RegCtrtTxReq(TxReq):
 
         return {
             "senderPublicKey": key_pair.pub.data,
-            "contract": md.Bytes(self.ctrt_meta.serialize()).b58_str,
-            "initData": md.Bytes(self.data_stack.serialize()).b58_str,
+            "contract": md.Bytes.to_b58_str(self.ctrt_meta_bytes),
+            "initData": md.Bytes.to_b58_str(self.data_stack_bytes),
             "description": self.description.data,
             "fee": self.fee.data,
             "feeScale": self.FEE_SCALE,
             "timestamp": self.timestamp.data,
-            "signature": md.Bytes(self.sign(key_pair)).b58_str,
+            "signature": md.Bytes.to_b58_str(self.sign(key_pair)),
         }
 
 
@@ -322,6 +377,15 @@ class ExecCtrtFuncTxReq(TxReq):
     """
 
     TX_TYPE = TxType.EXECUTE_CONTRACT_FUNCTION
+    __slots__ = (
+        "ctrt_id",
+        "func_id",
+        "data_stack",
+        "timestamp",
+        "attachment",
+        "fee",
+        "_data_stack_bytes",
+    )
 
     def __init__(
         self,
@@ -349,6 +413,21 @@ class ExecCtrtFuncTxReq(TxReq):
         self.attachment = attachment
         self.fee = fee
 
+    @property
+    def data_stack_bytes(self) -> bytes:
+        """
+        data_stack_bytes returns the serialized data stack.
+        It is needed both for signing & for the payload, so it is serialized once.
+
+        Returns:
+            bytes: The serialized data stack.
+        """
+        try:
+            return self._data_stack_bytes
+        except AttributeError:
+            b = self._data_stack_bytes = self.data_stack.serialize()
+            return b
+
     @property
     def data_to_sign(self) -> bytes:
         """
@@ -357,19 +436,19 @@ class ExecCtrtFuncTxReq(TxReq):
         Returns:
             bytes: The data to be signed for this request
         """
-        data_stack = self.data_stack.serialize()
-
-        return (
-            self.TX_TYPE.serialize()
-            + self.ctrt_id.bytes
-            + self.func_id.serialize()
-            + struct.pack(">H", len(data_stack))
-            + data_stack
-            + struct.pack(">H", len(self.attachment.data))
-            + self.attachment.bytes
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + struct.pack(">Q", self.timestamp.data)
+        data_stack = self.data_stack_bytes
+
+        return b"".join(
+            [
+                self.TX_TYPE.serialize(),
+                self.ctrt_id.bytes,
+                self.func_id.serialize(),
+                _U16.pack(len(data_stack)),
+                data_stack,
+                _U16.pack(len(self.attachment.data)),
+                self.attachment.bytes,
+                _FEE_TAIL.pack(self.fee.data, self.FEE_SCALE, self.timestamp.data),
+            ]
         )
 
     def to_broadcast_execute_payload(self, key_pair: md.KeyPair) -> Dict[str, Any]:
@@ -386,12 +465,12 @@ class ExecCtrtFuncTxReq(TxReq):
             "senderPublicKey": key_pair.pub.data,
             "contractId": self.ctrt_id.data,
             "functionIndex": self.func_id.value,
-            "functionData": md.Bytes(self.data_stack.serialize()).b58_str,
+            "functionData": md.Bytes.to_b58_str(self.data_stack_bytes),
             "attachment": self.attachment.b58_str,
             "fee": self.fee.data,
             "feeScale": self.FEE_SCALE,
             "timestamp": self.timestamp.data,
-            "signature": md.Bytes(self.sign(key_pair)).b58_str,
+            "signature": md.Bytes.to_b58_str(self.sign(key_pair)),
         }
 
 
@@ -401,6 +480,7 @@ class DBPutTxReq(TxReq):
     """
 
     TX_TYPE = TxType.DB_PUT
+    __slots__ = ("db_key", "data", "timestamp", "fee")
 
     def __init__(
         self,
@@ -427,9 +507,7 @@ class DBPutTxReq(TxReq):
             self.TX_TYPE.serialize()
             + self.db_key.serialize()
             + self.data.serialize()
-            + struct.pack(">Q", self.fee.data)
-            + struct.pack(">H", self.FEE_SCALE)
-            + struct.pack(">Q", self.timestamp.data)
+            + _FEE_TAIL.pack(self.fee.data, self.FEE_SCALE, self.timestamp.data)
         )
 
     def to_broadcast_put_payload(self, key_pair: md.KeyPair) -> Dict[str, Any]:
@@ -450,5 +528,5 @@ class DBPutTxReq(TxReq):
             "fee": self.fee.data,
             "feeScale": self.FEE_SCALE,
             "timestamp": self.timestamp.data,
-            "signature": md.Bytes(self.sign(key_pair)).b58_str,
+            "signature": md.Bytes.to_b58_str(self.sign(key_pair)),
         }
@@ -26,6 +26,7 @@ setuptools.setup(
     author_email="developers@v.systems",
     license="MIT",
     packages=setuptools.find_packages(),
+    package_data={"py_vsys.contract": ["meta/*.b58"]},
     install_requires=[
         "aiohttp~=3.8.1",
         "python-axolotl-curve25519~=0.4.1.post2",
@@ -27,7 +27,7 @@ def api_key() -> Optional[str]:
 async def api(host: str, api_key: str) -> pv.NodeAPI:
     a = await pv.NodeAPI.new(host, api_key)
     yield a
-    await a.sess.close()
+    await a.close()
 
 
 @pytest.fixture
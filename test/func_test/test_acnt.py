@@ -3,6 +3,7 @@ test_acnt contains functional tests for Account.
 """
 
 import uuid
+import base58
 import pytest
 
 import py_vsys as pv
@@ -83,6 +84,19 @@ class TestAccount:
             acnt = pv.Account(chain, pv.PriKey(self.PRI_KEY), pv.PubKey(wrong_pub_key))
             e_info.args[0] == "Public key & private key do not match."
 
+    def test_b58_str(self, chain: pv.Chain) -> None:
+        """
+        test_b58_str tests that b58_str of base58 string models encodes the string itself.
+
+        Args:
+            chain (pv.Chain): The chain.
+        """
+
+        acnt = pv.Account(chain, pv.PriKey(self.PRI_KEY))
+
+        assert acnt.addr.b58_str == base58.b58encode(self.ADDR).decode()
+        assert acnt.key_pair.pub.b58_str == base58.b58encode(self.PUB_KEY).decode()
+
     async def test_pay(self, acnt0: pv.Account, acnt1: pv.Account) -> None:
         """
         test_pay tests the method pay.
@@ -333,6 +333,35 @@ class TestVOptionCtrt:
             await oc.get_target_tok_bal(acnt0.addr.data)
         ).data == self.MAX_ISSUE_AMOUNT - self.MINT_AMOUNT + self.UNLOCK_AMOUNT
 
+    async def test_execute_many(
+        self, acnt0: pv.Account, new_v_option_ctrt_activated_and_minted: pv.VOptionCtrt
+    ) -> None:
+        """
+        test_execute_many tests the method execute_many.
+
+        Args:
+            acnt0 (pv.Account): The account of nonce 0.
+            new_v_option_ctrt_activated_and_minted (pv.VOptionCtrt): The fixture that registers a new V Option contract activated and minted.
+        """
+        oc = new_v_option_ctrt_activated_and_minted
+        api = acnt0.api
+
+        half = self.UNLOCK_AMOUNT // 2
+        resps = await oc.execute_many(
+            by=acnt0,
+            funcs=[
+                (oc.FuncIdx.UNLOCK, half),
+                (oc.FuncIdx.UNLOCK, half),
+            ],
+        )
+        await cft.wait_for_block()
+        for resp in resps:
+            await cft.assert_tx_success(api, resp["id"])
+
+        assert (
+            await oc.get_target_tok_bal(acnt0.addr.data)
+        ).data == self.MAX_ISSUE_AMOUNT - self.MINT_AMOUNT + half * 2
+
     async def test_execute_and_collect(
         self, acnt0: pv.Account, new_v_option_ctrt_activated_and_minted: pv.VOptionCtrt
     ) -> None:
@@ -368,6 +397,36 @@ class TestVOptionCtrt:
         target_tok_bal_col = await oc.get_target_tok_bal(acnt0.addr.data)
         assert (target_tok_bal_col.data - target_tok_bal_exec.data) == 9
 
+    def test_sync_facade(
+        self,
+        host: str,
+        api_key: str,
+        wallet: pv.Wallet,
+        new_v_option_ctrt_activated_and_minted: pv.VOptionCtrt,
+    ) -> None:
+        """
+        test_sync_facade tests the synchronous facade SyncVOptionCtrt.
+        It is not a coroutine as the facade runs its own event loop.
+
+        Args:
+            host (str): The host of the node.
+            api_key (str): The API key to the node.
+            wallet (pv.Wallet): The wallet.
+            new_v_option_ctrt_activated_and_minted (pv.VOptionCtrt): The fixture that registers a new V Option contract activated and minted.
+        """
+        oc = new_v_option_ctrt_activated_and_minted
+
+        sc = pv.SyncVOptionCtrt.new(oc.ctrt_id.data, host, pv.ChainID.TEST_NET, api_key)
+        acnt = wallet.get_account(sc.chain, 0)
+
+        resp = sc.unlock(by=acnt, amount=self.UNLOCK_AMOUNT)
+        time.sleep(cft.AVG_BLOCK_DELAY)
+        sc._loop.run_until_complete(cft.assert_tx_success(sc.chain.api, resp["id"]))
+
+        sc.close()
+        assert sc.chain.api.sess.closed
+        assert sc._loop.is_closed()
+
     @pytest.mark.whole
     async def test_as_whole(
         self,
@@ -205,6 +205,45 @@ class TestStableSwapCtrt:
 
         return order_id
 
+    async def test_set_orders(
+        self,
+        acnt0: pv.Account,
+        new_stable_ctrt: pv.VStableSwapCtrt,
+    ) -> None:
+        """
+        test_set_orders tests the method set_orders.
+
+        Args:
+            acnt0 (pv.Account): The account of nonce 0.
+            new_stable_ctrt (pv.VStableSwapCtrt): The fixture that registers a new V Stable Swap contract.
+        """
+        api = acnt0.api
+        ssc = new_stable_ctrt
+
+        order = ssc.SetOrderParams(
+            fee_base=1,
+            fee_target=1,
+            min_base=0,
+            max_base=100,
+            min_target=0,
+            max_target=100,
+            price_base=1,
+            price_target=1,
+            base_deposit=200,
+            target_deposit=200,
+        )
+        resps = await ssc.set_orders(acnt0, [order, order])
+        await cft.wait_for_block()
+        for resp in resps:
+            await cft.assert_tx_success(api, resp["id"])
+
+        base_tok_bal, target_tok_bal = await asyncio.gather(
+            ssc.get_base_tok_bal(acnt0.addr.data),
+            ssc.get_target_tok_bal(acnt0.addr.data),
+        )
+        assert base_tok_bal.amount == 600
+        assert target_tok_bal.amount == 600
+
     async def test_order_deposit_and_withdraw(
         self,
         acnt0: pv.Account,
@@ -287,6 +326,37 @@ class TestStableSwapCtrt:
         assert base_tok_bal.amount == 499
         assert target_tok_bal.amount == 499
 
+    async def test_get_order(
+        self,
+        acnt0: pv.Account,
+        new_stable_ctrt_with_order: Tuple[pv.VStableSwapCtrt, str],
+    ) -> None:
+        """
+        test_get_order tests the method get_order.
+
+        Args:
+            acnt0 (pv.Account): The account of nonce 0.
+            new_stable_ctrt_with_order (pv.VStableSwapCtrt): The fixture that registers a new V Stable Swap contract that already created an order.
+        """
+        ssc, order_id = new_stable_ctrt_with_order
+
+        order = await ssc.get_order(order_id)
+
+        assert order["owner"] == acnt0.addr
+        assert order["fee_base"].amount == 1
+        assert order["fee_target"].amount == 1
+        assert order["min_base"].amount == 0
+        assert order["max_base"].amount == 100
+        assert order["min_target"].amount == 0
+        assert order["max_target"].amount == 100
+        assert order["price_base"].amount == 1
+        assert order["price_target"].amount == 1
+        assert order["base_tok_locked"].amount == 500
+        assert order["target_tok_locked"].amount == 500
+        assert order["status"] is True
+
+        assert (await ssc.get_orders([order_id, order_id])) == [order, order]
+
     async def test_close_order(
         self,
         acnt0: pv.Account,